@@ -124,6 +124,9 @@ class App:
         self.progress_bar: Optional[ctk.CTkProgressBar] = None
         self.progress_label: Optional[ctk.CTkLabel] = None
         self.processed_claim_data = None  # Store processed data for CSV generation
+        # Widgets recolored by ThemeManager; filled in as UIBuilder creates them
+        self._themed_buttons = []
+        self._themed_frames = []
 
     def _initialize_processors(self):
         self.file_processor = FileProcessor(self)
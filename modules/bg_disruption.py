@@ -106,7 +106,7 @@ def load_data_files(file_paths):
     claims.info()
 
     # Load other data files with explicit column selection
-    medi = pd.read_excel(file_paths["medi_span"], engine="openpyxl")
+    medi = pd.read_excel(file_paths["medi_span"], dtype={"Maint Drug?": "category"}, engine="openpyxl")
     logger.info(f"medi shape: {medi.shape}")
 
     uni = pd.read_excel(file_paths["u_disrupt"], sheet_name="Universal NDC", usecols=["NDC", "Tier"], engine="openpyxl")
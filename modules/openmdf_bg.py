@@ -116,7 +116,7 @@ def load_data_files(file_paths):
     logger.info(f"After filter_recent_date: {claims.shape}")
 
     # Load other files with explicit column selection
-    medi = pd.read_excel(file_paths["medi_span"], engine="openpyxl")
+    medi = pd.read_excel(file_paths["medi_span"], dtype={"Maint Drug?": "category"}, engine="openpyxl")
     logger.info(f"medi shape: {medi.shape}")
 
     mdf = pd.read_excel(
@@ -102,7 +102,12 @@ def load_openmdf_tier_data(file_paths):
 
     # Load reference tables with explicit column selection
     try:
-        medi = pd.read_excel(file_paths["medi_span"], usecols=["NDC", "Maint Drug?", "Product Name"], engine="openpyxl")
+        medi = pd.read_excel(
+            file_paths["medi_span"],
+            usecols=["NDC", "Maint Drug?", "Product Name"],
+            dtype={"Maint Drug?": "category"},
+            engine="openpyxl",
+        )
         print(f"medi shape: {medi.shape}")
     except Exception as e:
         logger.error(f"Failed to read medi_span file: {file_paths['medi_span']} | {e}")
@@ -120,7 +120,12 @@ def load_tier_disruption_data(file_paths):
     claims.info()
 
     # Load reference tables with explicit column selection
-    medi = pd.read_excel(file_paths["medi_span"], usecols=["NDC", "Maint Drug?", "Product Name"], engine="openpyxl")
+    medi = pd.read_excel(
+        file_paths["medi_span"],
+        usecols=["NDC", "Maint Drug?", "Product Name"],
+        dtype={"Maint Drug?": "category"},
+        engine="openpyxl",
+    )
     print(f"medi shape: {medi.shape}")
 
     u = pd.read_excel(file_paths["u_disrupt"], sheet_name="Universal NDC", usecols=["NDC", "Tier"], engine="openpyxl")
@@ -60,7 +60,9 @@ class UIBuilder:
 
     def _create_button_frame(self):
         """Create the main button frame with all action buttons."""
-        self.app.button_frame = UIFactory.create_standard_frame(self.app.root)
+        self.app.button_frame = UIFactory.create_standard_frame(
+            self.app.root, self.app._themed_frames
+        )
         self.app.button_frame.grid(
             row=2, column=0, columnspan=3, sticky="ew", pady=10, padx=10
         )
@@ -80,7 +82,10 @@ class UIBuilder:
         """Create file import buttons and labels."""
         # Import File 1
         self.app.file1_button = UIFactory.create_standard_button(
-            self.app.button_frame, "Import File Uploaded to Tool", self.app.import_file1
+            self.app.button_frame,
+            "Import File Uploaded to Tool",
+            self.app.import_file1,
+            self.app._themed_buttons,
         )
         self.app.file1_button.grid(row=1, column=0, pady=10, padx=10, sticky="ew")
         self.app.file1_label = UIFactory.create_standard_label(
@@ -90,7 +95,10 @@ class UIBuilder:
 
         # Import File 2
         self.app.file2_button = UIFactory.create_standard_button(
-            self.app.button_frame, "Import File From Tool", self.app.import_file2
+            self.app.button_frame,
+            "Import File From Tool",
+            self.app.import_file2,
+            self.app._themed_buttons,
         )
         self.app.file2_button.grid(row=2, column=0, pady=10, padx=10, sticky="ew")
         self.app.file2_label = UIFactory.create_standard_label(
@@ -100,7 +108,10 @@ class UIBuilder:
 
         # Select Template
         self.app.template_button = UIFactory.create_standard_button(
-            self.app.button_frame, "Select Template File", self.app.import_template_file
+            self.app.button_frame,
+            "Select Template File",
+            self.app.import_template_file,
+            self.app._themed_buttons,
         )
         self.app.template_button.grid(row=3, column=0, pady=10, padx=10, sticky="ew")
         self.app.template_label = UIFactory.create_standard_label(
@@ -112,19 +123,28 @@ class UIBuilder:
         """Create action buttons (cancel, logs, theme)."""
         # Cancel button
         self.app.cancel_button = UIFactory.create_red_button(
-            self.app.button_frame, "Cancel", self.app.cancel_process
+            self.app.button_frame,
+            "Cancel",
+            self.app.cancel_process,
+            self.app._themed_buttons,
         )
         self.app.cancel_button.grid(row=4, column=0, pady=10, padx=10, sticky="ew")
 
         # View Logs button
         self.app.logs_button = UIFactory.create_standard_button(
-            self.app.button_frame, "View Logs", self.app.show_log_viewer
+            self.app.button_frame,
+            "View Logs",
+            self.app.show_log_viewer,
+            self.app._themed_buttons,
         )
         self.app.logs_button.grid(row=4, column=1, pady=10, padx=10, sticky="ew")
 
         # Toggle Dark Mode button
         self.app.toggle_theme_button = UIFactory.create_standard_button(
-            self.app.button_frame, "Switch to Dark Mode", self.toggle_dark_mode
+            self.app.button_frame,
+            "Switch to Dark Mode",
+            self.toggle_dark_mode,
+            self.app._themed_buttons,
         )
         self.app.toggle_theme_button.grid(
             row=4, column=2, pady=10, padx=10, sticky="ew"
@@ -146,13 +166,19 @@ class UIBuilder:
         """Create processing and LBL generation buttons."""
         # SHARx LBL button
         self.app.sharx_lbl_button = UIFactory.create_standard_button(
-            self.app.button_frame, "Generate SHARx LBL", self.app.sharx_lbl
+            self.app.button_frame,
+            "Generate SHARx LBL",
+            self.app.sharx_lbl,
+            self.app._themed_buttons,
         )
         self.app.sharx_lbl_button.grid(row=5, column=0, pady=10, padx=10, sticky="ew")
 
         # EPLS LBL button
         self.app.epls_lbl_button = UIFactory.create_standard_button(
-            self.app.button_frame, "Generate EPLS LBL", self.app.epls_lbl
+            self.app.button_frame,
+            "Generate EPLS LBL",
+            self.app.epls_lbl,
+            self.app._themed_buttons,
         )
         self.app.epls_lbl_button.grid(row=5, column=1, pady=10, padx=10, sticky="ew")
 
@@ -167,13 +193,16 @@ class UIBuilder:
             bg_color=LIGHT_COLORS["mint"],
             text_color="#000000",
         )
+        self.app._themed_buttons.append(self.app.start_process_button)
         self.app.start_process_button.grid(
             row=5, column=2, pady=10, padx=10, sticky="ew"
         )
 
     def _create_notes_frame(self):
         """Create the notes frame with important information."""
-        self.app.notes_frame = UIFactory.create_standard_frame(self.app.root)
+        self.app.notes_frame = UIFactory.create_standard_frame(
+            self.app.root, self.app._themed_frames
+        )
         self.app.notes_frame.grid(
             row=3, column=0, columnspan=4, sticky="ew", pady=10, padx=10
         )
@@ -185,7 +214,9 @@ class UIBuilder:
 
     def _create_disruption_frame(self):
         """Create the disruption type selector frame."""
-        self.app.dis_frame = UIFactory.create_standard_frame(self.app.root)
+        self.app.dis_frame = UIFactory.create_standard_frame(
+            self.app.root, self.app._themed_frames
+        )
         self.app.dis_frame.grid(
             row=4, column=0, columnspan=4, sticky="ew", pady=10, padx=10
         )
@@ -202,7 +233,9 @@ class UIBuilder:
 
     def _create_progress_frame(self):
         """Create the progress bar frame."""
-        self.app.prog_frame = UIFactory.create_standard_frame(self.app.root)
+        self.app.prog_frame = UIFactory.create_standard_frame(
+            self.app.root, self.app._themed_frames
+        )
         self.app.prog_frame.grid(
             row=5, column=0, columnspan=4, sticky="ew", pady=10, padx=10
         )
@@ -5,23 +5,27 @@ Script to update all references from write_audit_log to write_audit_log across t
 
 import os
 import re
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Compiled once for all files; word boundaries keep longer names intact
+_PAT = re.compile(rb"\bwrite_shared_log\b")
 
 
 def update_file(file_path):
     """Update a single file to replace write_audit_log with write_audit_log"""
     try:
-        # Use os to get file size (to avoid unused import warning)
-        _ = os.path.getsize(file_path)
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        # Track if any changes were made
-        original_content = content
+        # Work on raw bytes: no decode/encode round trip, and line endings
+        # are preserved exactly
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        # Most files never mention the old name; skip the regex pass for them
+        if b"write_shared_log" not in raw:
+            return False
         # Replace function calls
-        content = re.sub(r"\bwrite_shared_log\b", "write_audit_log", content)
+        content = _PAT.sub(b"write_audit_log", raw)
         # Only write if changes were made
-        if content != original_content:
-            with open(file_path, "w", encoding="utf-8") as f:
+        if content != raw:
+            with open(file_path, "wb") as f:
                 f.write(content)
             print(f"Updated: {file_path}")
             return True
@@ -31,32 +35,35 @@ def update_file(file_path):
         return False
 
 
-def main():
-    """Main function to update all Python files"""
-
-    # Find all Python files in modules directory
-    modules_dir = Path("modules")
-
-    files_to_update = []
+def iter_py(root, skip=()):
+    """Yield paths of the .py files directly inside root, except names in skip."""
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                # DirEntry.is_file() uses the cached d_type, no extra stat()
+                if (
+                    entry.name.endswith(".py")
+                    and entry.name not in skip
+                    and entry.is_file()
+                ):
+                    yield entry.path
+    except FileNotFoundError:
+        return
 
-    # Add specific files that we know need updating
-    for py_file in modules_dir.glob("*.py"):
-        files_to_update.append(py_file)
 
-    # Also check other directories
-    for py_file in Path("tests").glob("*.py"):
-        files_to_update.append(py_file)
+def main():
+    """Main function to update all Python files"""
 
-    for py_file in Path("utils").glob("*.py"):
-        if (
-            py_file.name != "utils.py"
-        ):  # Skip the main utils.py since we already updated it
-            files_to_update.append(py_file)
+    files_to_update = [
+        *iter_py("modules"),
+        *iter_py("tests"),
+        # Skip the main utils.py since we already updated it
+        *iter_py("utils", skip={"utils.py"}),
+    ]
 
-    updated_count = 0
-    for file_path in files_to_update:
-        if update_file(file_path):
-            updated_count += 1
+    # Each file is read and rewritten independently, so the I/O can overlap
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+        updated_count = sum(ex.map(update_file, files_to_update))
 
     print(f"Updated {updated_count} files total")
 
@@ -1,8 +1,92 @@
+import base64
 import os
+import sys
+from pathlib import Path
 
 import pytest
 from openpyxl import Workbook
 
+# Put the project root on sys.path once, before any test module is
+# collected, so tests can import modules/, utils/ and config/ directly
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Minimal .xlsx (no styles or theme) with "Sheet1" and "Line By Line" sheets,
+# each holding Header1/Header2 in row 1. Writing these bytes is much cheaper
+# than building and saving the same workbook through openpyxl.
+_TEMPLATE_B64 = (
+    "UEsDBBQAAAAIAAAAIQBZtGQMBgEAALYCAAATAAAAW0NvbnRlbnRfVHlwZXNdLnhtbLWSzU7D"
+    "MBCE7zyF5WsVO+0BIdSkB36OwKE8wOJsEiv+k9ct6dvjpBUHVEBI9LSyZ2a/keX1ZrSG7TGS"
+    "9q7iS1Fyhk75Rruu4q/bx+KGM0rgGjDeYcUPSHxTX623h4DEcthRxfuUwq2UpHq0QMIHdFlp"
+    "fbSQ8jF2MoAaoEO5KstrqbxL6FKRph28Xt9jCzuT2MOYr49FIhri7O5onFgVhxCMVpCyLveu"
+    "+UIpTgSRk7OHeh1okQ1cniVMyveAU+45v0zUDbIXiOkJbHbJ0ch3H4c37wfx85IzLX3baoWN"
+    "VzubI4JCRGioR0zWiHkKC9otfufPZpLzWP5zkc/9f+yxunQPOX+7+gNQSwMEFAAAAAgAAAAh"
+    "AAZZx4KxAAAAKAEAAAsAAABfcmVscy8ucmVsc43PsQ6CMBAG4N2naG6XgoMxhsJiTFgNPkBt"
+    "j0KAXtNWhbe3oxoHx8v99/25sl7miT3Qh4GsgCLLgaFVpAdrBFzb8/YALERptZzIooAVA9TV"
+    "przgJGO6Cf3gAkuIDQL6GN2R86B6nGXIyKFNm478LGMaveFOqlEa5Ls833P/bkD1YbJGC/CN"
+    "LoC1q8N/bOq6QeGJ1H1GG39UfCWSLL3BKGCZ+JP8eCMas4QCr0r+8WD1AlBLAwQUAAAACAAA"
+    "ACEAGi1Sic8AAABQAQAADwAAAHhsL3dvcmtib29rLnhtbI1QzWrDMAy+7ymM7quTHMYISQpl"
+    "DAq7dXsAL1Ya01gKkteft5+zrtDddvokpO9HatbnOJkjigamFspVAQapZx9o38LH++vjMxhN"
+    "jrybmLCFCyqsu4fmxHL4ZD6YzCdtYUxprq3VfsTodMUzUp4MLNGl3Mre6izovI6IKU62Koon"
+    "G10guCrU8h8NHobQ4wv3XxEpXUUEJ5dyeh3DrNA1Pw76i4ZczKl3S13mSxbc+nwoGKlDLmTr"
+    "S7B/t98CodlczIJ3nOqOUy0ce7Oyt29031BLAwQUAAAACAAAACEAEscajL0AAAC2AQAAGgAA"
+    "AHhsL19yZWxzL3dvcmtib29rLnhtbC5yZWxzvZBNC8IwDIbv/oqSu8u2g4is20WEXUV/QOmy"
+    "D7a1palf/94iKAoePHkKyUuePKSorvMkzuR5sEZClqQgyGjbDKaTcDzslmsQHJRp1GQNSbgR"
+    "Q1Uuij1NKsQd7gfHIkIMS+hDcBtE1j3NihPryMSktX5WIba+Q6f0qDrCPE1X6N8ZUH4wRd1I"
+    "8HWTgTjcHP3Ctm07aNpafZrJhC8n8GL9yD1RiFDlOwoSXiPGR8mSSAX8LpP/WSZ/yuDHu8s7"
+    "UEsDBBQAAAAIAAAAIQDx6Sb6vQAAAB8BAAAYAAAAeGwvd29ya3NoZWV0cy9zaGVldDEueG1s"
+    "fY/BSgNBDIbvPsWQe5vdHkRkZoqllN7VBxh2Y3dwJ7NMQqtvb1pE9OIlJF/4//zx248yuzM1"
+    "yZUD9OsOHPFQx8ynAK8vh9UDONHEY5orU4BPEtjGO3+p7V0mInVmwBJgUl0eEWWYqCRZ14XY"
+    "Nm+1laQ2thPK0iiNN1GZcdN191hSZoj+xvZJU/StXlyzIEaHa/PUg9MAmefM9KzNeJboNR7N"
+    "i1rvUaPHK8LhW7L7X7L5K0G7aPVXBPz5LX4BUEsDBBQAAAAIAAAAIQDx6Sb6vQAAAB8BAAAY"
+    "AAAAeGwvd29ya3NoZWV0cy9zaGVldDIueG1sfY/BSgNBDIbvPsWQe5vdHkRkZoqllN7VBxh2"
+    "Y3dwJ7NMQqtvb1pE9OIlJF/4//zx248yuzM1yZUD9OsOHPFQx8ynAK8vh9UDONHEY5orU4BP"
+    "EtjGO3+p7V0mInVmwBJgUl0eEWWYqCRZ14XYNm+1laQ2thPK0iiNN1GZcdN191hSZoj+xvZJ"
+    "U/StXlyzIEaHa/PUg9MAmefM9KzNeJboNR7Ni1rvUaPHK8LhW7L7X7L5K0G7aPVXBPz5LX4B"
+    "UEsBAhQDFAAAAAgAAAAhAFm0ZAwGAQAAtgIAABMAAAAAAAAAAAAAAIABAAAAAFtDb250ZW50"
+    "X1R5cGVzXS54bWxQSwECFAMUAAAACAAAACEABlnHgrEAAAAoAQAACwAAAAAAAAAAAAAAgAE3"
+    "AQAAX3JlbHMvLnJlbHNQSwECFAMUAAAACAAAACEAGi1Sic8AAABQAQAADwAAAAAAAAAAAAAA"
+    "gAERAgAAeGwvd29ya2Jvb2sueG1sUEsBAhQDFAAAAAgAAAAhABLHGoy9AAAAtgEAABoAAAAA"
+    "AAAAAAAAAIABDQMAAHhsL19yZWxzL3dvcmtib29rLnhtbC5yZWxzUEsBAhQDFAAAAAgAAAAh"
+    "APHpJvq9AAAAHwEAABgAAAAAAAAAAAAAAIABAgQAAHhsL3dvcmtzaGVldHMvc2hlZXQxLnht"
+    "bFBLAQIUAxQAAAAIAAAAIQDx6Sb6vQAAAB8BAAAYAAAAAAAAAAAAAACAAfUEAAB4bC93b3Jr"
+    "c2hlZXRzL3NoZWV0Mi54bWxQSwUGAAAAAAYABgCLAQAA6AUAAAAA"
+)
+
+
+def write_dummy_template(path):
+    """Write the two-header dummy template to path and return path."""
+    path = Path(path)
+    path.write_bytes(base64.b64decode(_TEMPLATE_B64))
+    return path
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-import-cache",
+        action="store_true",
+        default=False,
+        help="Import every file in test_import_only, ignoring the mtime cache.",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: runs a full end-to-end pipeline; select with -m slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Slow tests only run when the -m expression asks for them
+    if "slow" in config.getoption("markexpr"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test; run with -m slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
 
 @pytest.fixture(scope="session", autouse=True)
 def create_dummy_excel():
@@ -19,3 +103,137 @@ def create_dummy_excel():
     yield
     # Optionally, remove the file after tests
     # os.remove(filename)
+
+
+# Shared fixtures are built once per session; tests must not mutate them.
+# pandas is imported inside them so structural tests that never request
+# them (test_directory_structure.py, test_file_paths.py) stay cheap.
+
+
+@pytest.fixture(scope="session")
+def sample_network_df():
+    """Network rows covering yes/no in mixed case and an unexpected token."""
+    import pandas as pd
+
+    return pd.DataFrame(
+        {
+            "pharmacy_nabp": ["1234567", "7654321", "1111111", "5555555"],
+            "pharmacy_npi": ["1111111111", "2222222222", "5555555555", "3333333333"],
+            "pharmacy_is_excluded": ["Yes", "no", "No", "maybe"],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_claims_df():
+    """Claims matching sample_network_df by NABP, by NPI only, and not at all."""
+    import pandas as pd
+
+    return pd.DataFrame(
+        {
+            "NABP": ["1234567", "7654321", "1111111", "9999999", ""],
+            "PHARMACYNPI": [
+                "1111111111",
+                "2222222222",
+                "5555555555",
+                "0000000000",
+                "3333333333",
+            ],
+        }
+    )
+
+
+@pytest.fixture
+def audit_logger(tmp_path, monkeypatch):
+    """A fresh audit logger whose shared log lives in tmp_path.
+
+    Runs never touch the real Logs/{username}/Audit_Log.csv, and closing
+    this logger leaves the process-wide one open for later tests.
+    """
+    from utils import utils
+
+    # setitem, not setattr: reading the old value through the module
+    # __getattr__ would load config/file_paths.json, which may not exist
+    monkeypatch.setitem(vars(utils), "audit_log_path", tmp_path / "Audit_Log.csv")
+    logger = utils._AuditLogger()
+    monkeypatch.setattr(utils, "_audit_logger", logger)
+    yield logger
+    logger.flush_and_close()
+
+
+@pytest.fixture(scope="session")
+def dummy_xlsx_template(tmp_path_factory):
+    """Path to a read-only template with Header1/Header2 on each sheet.
+
+    Tests that write back over the template should copy it first.
+    """
+    return write_dummy_template(
+        tmp_path_factory.mktemp("templates") / "dummy_template.xlsx"
+    )
+
+
+@pytest.fixture(scope="session")
+def gross_cost_files(tmp_path_factory):
+    """Write the GrossCost template-validation inputs once per session.
+
+    Returns a dict with "csv" and "xlsx" paths that have a GrossCost column
+    and a "no_grosscost_csv" path that does not.
+    """
+    import pandas as pd
+
+    fixtures_dir = tmp_path_factory.mktemp("fixtures")
+    member_ids = ["M001", "M002", "M003", "M004", "M005"]
+    paths = {
+        "csv": fixtures_dir / "test_grosscost.csv",
+        "xlsx": fixtures_dir / "test_grosscost.xlsx",
+        "no_grosscost_csv": fixtures_dir / "test_no_grosscost.csv",
+    }
+    pd.DataFrame(
+        {
+            "SOURCERECORDID": [1, 2, 3, 4, 5],
+            "GrossCost": [0, 0, 10.50, 25.00, 0],
+            "MemberID": member_ids,
+        }
+    ).to_csv(paths["csv"], index=False)
+    pd.DataFrame(
+        {
+            "SOURCERECORDID": [1, 2, 3, 4, 5],
+            "GrossCost": [15.50, 22.00, 8.75, 45.00, 12.25],
+            "MemberID": member_ids,
+        }
+    ).to_excel(paths["xlsx"], index=False)
+    pd.DataFrame(
+        {
+            "SOURCERECORDID": [1, 2, 3, 4, 5],
+            "Amount": [15.50, 22.00, 8.75, 45.00, 12.25],
+            "MemberID": member_ids,
+        }
+    ).to_csv(paths["no_grosscost_csv"], index=False)
+    return paths
+
+
+@pytest.fixture(scope="session")
+def n_disrupt_network():
+    """Read the n_disrupt network once and index its normalised NABPs.
+
+    Returns (net, nabp_index); nabp_index is positionally aligned with net
+    and holds the stripped, uppercased pharmacy_nabp values, so lookups
+    are hash probes rather than a full-column scan per NABP.
+    """
+    import pandas as pd
+
+    from config.config_loader import ConfigLoader
+
+    try:
+        fp = ConfigLoader.load_file_paths()
+    except (FileNotFoundError, RuntimeError) as e:
+        pytest.skip(f"file paths not configured: {e}")
+    if not os.path.exists(fp.get("n_disrupt", "")):
+        pytest.skip("n_disrupt network file not available")
+    net = pd.read_csv(
+        fp["n_disrupt"],
+        usecols=["pharmacy_nabp", "pharmacy_npi", "pharmacy_is_excluded"],
+        dtype=str,
+    )
+    nabp_index = pd.Index(net["pharmacy_nabp"].str.strip().str.upper())
+    return net, nabp_index
@@ -3,15 +3,38 @@ RowID Error Analyzer and Fixer
 Diagnoses and fixes the 'RowID' column error in merged_file.xlsx processing.
 """
 
+import importlib.util
+import json
 import logging
 import os
+import shutil
 import sys
 import traceback
 from datetime import datetime
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; sorting falls back to np.lexsort
+    njit = None
+
+try:
+    import orjson
+
+    ORJSON_REPORT_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NAIVE_UTC
+        | orjson.OPT_NON_STR_KEYS
+    )
+except ImportError:
+    # orjson is optional; reports fall back to the stdlib json module
+    orjson = None
+
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -27,6 +50,96 @@ except ImportError:
     # Fallback if config not available
     REQUIRED_COLUMNS = ["DATEFILLED", "SOURCERECORDID", "NDC", "MemberID"]
 
+# Resolved once at import; immutable so they can be shared safely
+REQUIRED_COLUMNS = tuple(REQUIRED_COLUMNS)
+REQUIRED_COLUMNS_SET = frozenset(REQUIRED_COLUMNS)
+SORT_COLUMNS = ("DATEFILLED", "SOURCERECORDID")
+# Columns read from the merged file for analysis
+ANALYSIS_COLUMNS = REQUIRED_COLUMNS_SET | {"RowID", "Logic", *SORT_COLUMNS}
+
+# Code examples attached to fix suggestions
+ROWID_FIX_EXAMPLE = """
+try:
+    df["RowID"] = np.arange(len(df))
+except Exception as e:
+    logging.error(f"RowID creation failed: {e}")
+    # Fallback: use index
+    df["RowID"] = df.index
+"""
+
+SORT_FIX_EXAMPLE = """
+# Validate sort columns before sorting
+required_sort_cols = ["DATEFILLED", "SOURCERECORDID"]
+available_cols = [col for col in required_sort_cols if col in df.columns]
+
+if len(available_cols) < len(required_sort_cols):
+    missing_cols = set(required_sort_cols) - set(available_cols)
+    raise ValueError(f"Missing required columns for sorting: {missing_cols}")
+
+# Safe sorting with error handling
+try:
+    df = df.sort_values(by=available_cols, ascending=True)
+except Exception as e:
+    logging.warning(f"Sorting failed: {e}. Using original order.")
+"""
+
+MULTIPROCESSING_FIX_EXAMPLE = """
+# Ensure proper data copying for multiprocessing
+def safe_multiprocessing_split(df, num_workers):
+    try:
+        # Create deep copies to avoid multiprocessing issues
+        df_blocks = [block.copy() for block in np.array_split(df, num_workers)]
+        return df_blocks
+    except Exception as e:
+        logging.error(f"Multiprocessing split failed: {e}")
+        return [df]  # Fallback to single process
+"""
+
+# Memory usage above this many MB triggers a chunked-processing recommendation
+MEMORY_WARNING_MB = 500
+# Rows sampled for the deep (object-aware) memory estimate
+MEMORY_SAMPLE_ROWS = 1000
+# Arrow-backed strings avoid one Python object per row and hash/sort in C++
+STRING_DTYPE = "string[pyarrow]" if importlib.util.find_spec("pyarrow") else "string"
+
+
+def rowid_dtype(row_count):
+    """Return the narrowest integer dtype able to hold RowIDs 0..row_count-1."""
+    return np.int32 if row_count < 2**31 else np.int64
+
+
+def sort_key_codes(df, columns):
+    """Encode sort columns as an (n_rows, n_columns) int64 array of codes.
+
+    Codes preserve each column's sort order; nulls get the largest code so
+    they sort last, as they would with sort_values.
+    """
+    keys = np.empty((len(df), len(columns)), dtype=np.int64)
+    for i, col in enumerate(columns):
+        codes, uniques = pd.factorize(df[col], sort=True)
+        codes[codes < 0] = len(uniques)
+        keys[:, i] = codes
+    return keys
+
+
+def _lexsort_codes(keys):
+    """Return the stable row order sorting by each key column, first major."""
+    order = np.arange(keys.shape[0])
+    for k in range(keys.shape[1] - 1, -1, -1):
+        order = order[np.argsort(keys[order, k], kind="mergesort")]
+    return order
+
+
+if njit is not None:
+    _lexsort_codes = njit(cache=True)(_lexsort_codes)
+
+
+def lexsort_codes(keys):
+    """Return the row order for integer sort keys from sort_key_codes()."""
+    if njit is None:
+        return np.lexsort(keys.T[::-1])
+    return _lexsort_codes(keys)
+
 
 class RowIDErrorAnalyzer:
     """Analyzes and fixes RowID-related errors in data processing."""
@@ -61,13 +174,14 @@ class RowIDErrorAnalyzer:
         try:
             # Load the file
             self.logger.info("Loading Excel file...")
-            df = pd.read_excel(file_path)
+            df, all_columns = self.load_analysis_columns(file_path)
             self.logger.info(
-                f"Successfully loaded {len(df)} rows, {len(df.columns)} columns"
+                f"Successfully loaded {len(df)} rows, {len(all_columns)} columns "
+                f"({len(df.columns)} used for analysis)"
             )
 
             # Analyze the data structure
-            analysis_results = self.analyze_dataframe_structure(df)
+            analysis_results = self.analyze_dataframe_structure(df, all_columns)
 
             # Test RowID creation
             rowid_test_results = self.test_rowid_creation(df)
@@ -88,55 +202,143 @@ class RowIDErrorAnalyzer:
             self.logger.error(f"Error during analysis: {error_details}")
             return self.create_error_report("ANALYSIS_ERROR", error_details)
 
-    def analyze_dataframe_structure(self, df):
-        """Analyze the DataFrame structure for potential issues."""
+    def load_analysis_columns(self, file_path):
+        """Load only the columns the analysis inspects.
+
+        Reads the header first, then re-reads the sheet limited to the
+        required, sort and RowID/Logic columns so unused columns are never
+        parsed. Returns the DataFrame and the full list of header columns.
+        """
+        all_columns = list(pd.read_excel(file_path, nrows=0).columns)
+        usecols = [col for col in all_columns if col in ANALYSIS_COLUMNS]
+        if not usecols:
+            # Keep one column so the row count is still available
+            usecols = all_columns[:1]
+
+        dtype = {
+            col: STRING_DTYPE
+            for col in ("SOURCERECORDID", "MemberID", "NDC")
+            if col in usecols
+        }
+        parse_dates = ["DATEFILLED"] if "DATEFILLED" in usecols else False
+        df = pd.read_excel(
+            file_path,
+            usecols=usecols or None,
+            dtype=dtype,
+            parse_dates=parse_dates,
+        )
+        return df, all_columns
+
+    def analyze_dataframe_structure(self, df, all_columns=None, verbose=False):
+        """Analyze the DataFrame structure for potential issues.
+
+        The list of entirely empty columns is not used by any recommendation
+        and is only included when verbose is True.
+        """
         results = {}
+        col_set = set(df.columns)
+        columns = list(df.columns) if all_columns is None else list(all_columns)
 
         # Basic info
-        results["shape"] = df.shape
-        results["columns"] = list(df.columns)
-        results["dtypes"] = df.dtypes.to_dict()
-        results["memory_usage_mb"] = df.memory_usage(deep=True).sum() / 1024 / 1024
+        results["shape"] = (len(df), len(columns))
+        results["columns"] = columns
+        results["dtypes"] = {col: dtype.name for col, dtype in df.dtypes.items()}
+        results["memory_usage_mb"] = self.estimate_memory_usage_mb(df)
 
         # Check for existing RowID column
-        results["has_existing_rowid"] = "RowID" in df.columns
+        results["has_existing_rowid"] = "RowID" in col_set
         if results["has_existing_rowid"]:
+            rowid = df["RowID"]
+            has_nulls = bool(rowid.isnull().any())
+            # is_unique stops at the first duplicate; nunique() is only
+            # needed when duplicates or nulls are present
+            unique_count = (
+                len(rowid) if rowid.is_unique and not has_nulls else rowid.nunique()
+            )
             results["existing_rowid_info"] = {
-                "dtype": str(df["RowID"].dtype),
-                "unique_count": df["RowID"].nunique(),
-                "has_nulls": df["RowID"].isnull().any(),
-                "sample_values": df["RowID"].head(10).tolist(),
+                "dtype": rowid.dtype.name,
+                "unique_count": unique_count,
+                "has_nulls": has_nulls,
+                "sample_values": rowid.head(10).to_numpy().tolist(),
             }
 
         # Check required columns from config/app_config or fallback
-        required_cols = REQUIRED_COLUMNS
         results["missing_required_columns"] = [
-            col for col in required_cols if col not in df.columns
+            col for col in REQUIRED_COLUMNS if col not in col_set
         ]
         results["has_all_required"] = len(results["missing_required_columns"]) == 0
 
-        # Check for data quality issues
+        # Check for data quality issues (one null scan shared by all checks)
+        null_counts = df.isnull().sum()
+        duplicate_rows, duplicate_key = self.count_duplicate_rows(df)
         results["data_quality"] = {
-            "total_nulls": df.isnull().sum().sum(),
-            "duplicate_rows": df.duplicated().sum(),
-            "empty_columns": [col for col in df.columns if df[col].isnull().all()],
+            "total_nulls": int(null_counts.sum()),
+            "duplicate_rows": duplicate_rows,
+            "duplicate_key_columns": duplicate_key,
         }
+        if verbose:
+            results["data_quality"]["empty_columns"] = null_counts.index[
+                null_counts == len(df)
+            ].tolist()
 
-        # Check key columns for sorting
-        sort_columns = ["DATEFILLED", "SOURCERECORDID"]
+        # Check key columns for sorting, reusing the null counts and dtype
+        # names computed above instead of indexing each column again
         results["sort_column_issues"] = {}
-        for col in sort_columns:
-            if col in df.columns:
-                results["sort_column_issues"][col] = {
-                    "has_nulls": df[col].isnull().any(),
-                    "null_count": df[col].isnull().sum(),
-                    "dtype": str(df[col].dtype),
-                }
-            else:
+        for col in SORT_COLUMNS:
+            if col not in col_set:
                 results["sort_column_issues"][col] = {"missing": True}
+                continue
+            null_count = int(null_counts[col])
+            results["sort_column_issues"][col] = {
+                "has_nulls": null_count > 0,
+                "null_count": null_count,
+                "dtype": results["dtypes"][col],
+            }
 
         return results
 
+    def count_duplicate_rows(self, df):
+        """Count duplicate rows by hashing a key subset instead of every column.
+
+        SOURCERECORDID identifies a claim, so when present the count is rows
+        minus its distinct values. Otherwise up to four non-object columns
+        (or the first four columns) are used, which approximates a full-row
+        duplicate check. Returns the count and the key columns used.
+        """
+        if "SOURCERECORDID" in df.columns:
+            key_columns = ["SOURCERECORDID"]
+            duplicates = len(df) - df["SOURCERECORDID"].nunique(dropna=False)
+        else:
+            key_columns = [col for col in df.columns if df[col].dtype != object]
+            key_columns = key_columns[:4] or list(df.columns[:4])
+            if not key_columns:
+                return 0, key_columns
+            duplicates = df.duplicated(subset=key_columns).sum()
+        return int(duplicates), key_columns
+
+    def estimate_memory_usage_mb(self, df):
+        """Estimate DataFrame memory usage in MB from a sample of rows.
+
+        A deep measurement walks every Python object in object columns, so
+        only the first MEMORY_SAMPLE_ROWS rows are measured and scaled up.
+        The exact figure is computed only when the estimate lands within
+        20% of MEMORY_WARNING_MB, where the recommendation depends on it.
+        """
+        row_count = len(df)
+        sample_rows = min(row_count, MEMORY_SAMPLE_ROWS)
+        if sample_rows == row_count:
+            return df.memory_usage(deep=True).sum() / 1024 / 1024
+
+        sample_bytes = df.head(sample_rows).memory_usage(deep=True, index=False).sum()
+        estimate_mb = (
+            (df.index.memory_usage() + sample_bytes * row_count / sample_rows)
+            / 1024
+            / 1024
+        )
+        if abs(estimate_mb - MEMORY_WARNING_MB) <= MEMORY_WARNING_MB * 0.2:
+            return df.memory_usage(deep=True).sum() / 1024 / 1024
+        return estimate_mb
+
     def test_rowid_creation(self, df):
         """Test the RowID creation process to identify where it fails."""
         results = {}
@@ -144,9 +346,8 @@ class RowIDErrorAnalyzer:
         try:
             # Test 1: Basic RowID creation
             self.logger.info("Testing basic RowID creation...")
-            test_df = df.copy()
-            test_df["RowID"] = np.arange(len(test_df))
-            results["basic_creation"] = {"success": True, "length": len(test_df)}
+            rowid = np.arange(len(df), dtype=rowid_dtype(len(df)))
+            results["basic_creation"] = {"success": True, "length": rowid.size}
             self.logger.info("✓ Basic RowID creation successful")
 
         except Exception as e:
@@ -160,20 +361,18 @@ class RowIDErrorAnalyzer:
         try:
             # Test 2: Sorting before RowID creation
             self.logger.info("Testing sorting before RowID creation...")
-            test_df = df.copy()
 
             # Check if sort columns exist
-            sort_cols = ["DATEFILLED", "SOURCERECORDID"]
-            available_sort_cols = [col for col in sort_cols if col in test_df.columns]
+            available_sort_cols = [col for col in SORT_COLUMNS if col in df.columns]
 
             if available_sort_cols:
-                test_df = test_df.sort_values(by=available_sort_cols, ascending=True)
-                test_df["Logic"] = ""
-                test_df["RowID"] = np.arange(len(test_df))
+                # Sort integer codes of the key columns without copying the frame
+                order = lexsort_codes(sort_key_codes(df, available_sort_cols))
+                rowid = np.arange(order.size, dtype=rowid_dtype(order.size))
                 results["sort_and_create"] = {
                     "success": True,
                     "sorted_by": available_sort_cols,
-                    "length": len(test_df),
+                    "length": rowid.size,
                 }
                 self.logger.info(
                     f"✓ Sort and RowID creation successful (sorted by: {available_sort_cols})"
@@ -181,10 +380,10 @@ class RowIDErrorAnalyzer:
             else:
                 results["sort_and_create"] = {
                     "success": False,
-                    "error": f"Required sort columns not found: {sort_cols}",
-                    "available_columns": list(test_df.columns),
+                    "error": f"Required sort columns not found: {list(SORT_COLUMNS)}",
+                    "available_columns": list(df.columns),
                 }
-                self.logger.error(f"✗ Sort columns not available: {sort_cols}")
+                self.logger.error(f"✗ Sort columns not available: {list(SORT_COLUMNS)}")
 
         except Exception as e:
             results["sort_and_create"] = {
@@ -198,24 +397,18 @@ class RowIDErrorAnalyzer:
             # Test 3: Multiprocessing compatibility
             self.logger.info("Testing multiprocessing compatibility...")
 
-            # Split dataframe (simulating multiprocessing)
+            # Split row positions rather than data (simulating multiprocessing);
+            # np.array_split is what the real pipeline uses, and the splits
+            # are views into a single int64 array
             num_splits = 4
-            df_splits = np.array_split(df, num_splits)
-
-            processed_splits = []
-            for i, split_df in enumerate(df_splits):
-                # Simulate the processing that would happen in multiprocessing
-                split_copy = split_df.copy()
-                split_copy["RowID"] = np.arange(len(split_copy))
-                processed_splits.append(split_copy)
-
-            # Recombine
-            combined_df = pd.concat(processed_splits, ignore_index=True)
+            index_splits = np.array_split(
+                np.arange(len(df), dtype=np.int64), num_splits
+            )
 
             results["multiprocessing_test"] = {
                 "success": True,
-                "splits_count": len(df_splits),
-                "combined_length": len(combined_df),
+                "splits_count": len(index_splits),
+                "combined_length": int(sum(split.size for split in index_splits)),
                 "original_length": len(df),
             }
             self.logger.info("✓ Multiprocessing compatibility test successful")
@@ -299,7 +492,7 @@ class RowIDErrorAnalyzer:
 
         # Memory usage check
         memory_mb = structure_analysis.get("memory_usage_mb", 0)
-        if memory_mb > 500:  # More than 500MB
+        if memory_mb > MEMORY_WARNING_MB:
             recommendations.append(
                 {
                     "priority": "MEDIUM",
@@ -314,7 +507,10 @@ class RowIDErrorAnalyzer:
             recommendations.append(
                 {
                     "priority": "LOW",
-                    "issue": f"Duplicate rows found: {data_quality['duplicate_rows']}",
+                    "issue": (
+                        f"Duplicate rows found: {data_quality['duplicate_rows']} "
+                        f"(by {data_quality.get('duplicate_key_columns')})"
+                    ),
                     "recommendation": "Consider removing duplicates before processing",
                 }
             )
@@ -331,14 +527,7 @@ class RowIDErrorAnalyzer:
                 {
                     "fix_type": "CODE_FIX",
                     "description": "Add error handling for RowID creation",
-                    "code_example": """
-try:
-    df["RowID"] = np.arange(len(df))
-except Exception as e:
-    logging.error(f"RowID creation failed: {e}")
-    # Fallback: use index
-    df["RowID"] = df.index
-""",
+                    "code_example": ROWID_FIX_EXAMPLE,
                 }
             )
 
@@ -348,21 +537,7 @@ except Exception as e:
                 {
                     "fix_type": "DATA_VALIDATION",
                     "description": "Add validation for sort columns",
-                    "code_example": """
-# Validate sort columns before sorting
-required_sort_cols = ["DATEFILLED", "SOURCERECORDID"]
-available_cols = [col for col in required_sort_cols if col in df.columns]
-
-if len(available_cols) < len(required_sort_cols):
-    missing_cols = set(required_sort_cols) - set(available_cols)
-    raise ValueError(f"Missing required columns for sorting: {missing_cols}")
-
-# Safe sorting with error handling
-try:
-    df = df.sort_values(by=available_cols, ascending=True)
-except Exception as e:
-    logging.warning(f"Sorting failed: {e}. Using original order.")
-""",
+                    "code_example": SORT_FIX_EXAMPLE,
                 }
             )
 
@@ -372,17 +547,7 @@ except Exception as e:
                 {
                     "fix_type": "MULTIPROCESSING_FIX",
                     "description": "Fix multiprocessing data handling",
-                    "code_example": """
-# Ensure proper data copying for multiprocessing
-def safe_multiprocessing_split(df, num_workers):
-    try:
-        # Create deep copies to avoid multiprocessing issues
-        df_blocks = [block.copy() for block in np.array_split(df, num_workers)]
-        return df_blocks
-    except Exception as e:
-        logging.error(f"Multiprocessing split failed: {e}")
-        return [df]  # Fallback to single process
-""",
+                    "code_example": MULTIPROCESSING_FIX_EXAMPLE,
                 }
             )
 
@@ -390,14 +555,22 @@ def safe_multiprocessing_split(df, num_workers):
 
     def save_report_to_file(self, report):
         """Save the detailed report to a file."""
-        import json
-
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"rowid_error_analysis_{timestamp}.json"
 
         try:
-            with open(filename, "w") as f:
-                json.dump(report, f, indent=2, default=str)
+            payload = None
+            if orjson is not None:
+                try:
+                    # orjson encodes numpy scalars/arrays natively in C
+                    payload = orjson.dumps(
+                        report, default=str, option=ORJSON_REPORT_OPTIONS
+                    )
+                except TypeError as e:
+                    self.logger.warning(f"orjson encoding failed: {e}. Using json.")
+            if payload is None:
+                payload = json.dumps(report, indent=2, default=str).encode()
+            Path(filename).write_bytes(payload)
             self.logger.info(f"Detailed report saved to: {filename}")
         except Exception as e:
             self.logger.error(f"Failed to save report: {e}")
@@ -445,8 +618,14 @@ def safe_multiprocessing_split(df, num_workers):
             "status": "ANALYSIS_FAILED",
         }
 
-    def fix_common_rowid_issues(self, file_path="merged_file.xlsx"):
-        """Attempt to fix common RowID issues in the file."""
+    def fix_common_rowid_issues(
+        self, file_path="merged_file.xlsx", prefer_parquet=False
+    ):
+        """Attempt to fix common RowID issues in the file.
+
+        The fixed data is written as xlsx, or as a zstd-compressed Parquet
+        file when prefer_parquet is True.
+        """
         self.logger.info("=== Attempting to Fix RowID Issues ===")
 
         if not os.path.exists(file_path):
@@ -458,17 +637,18 @@ def safe_multiprocessing_split(df, num_workers):
             df = pd.read_excel(file_path)
             self.logger.info(f"Loaded file with {len(df)} rows")
 
-            # Create backup
+            # Create backup (a byte copy of the source, no re-serialization)
             backup_path = file_path.replace(".xlsx", "_backup.xlsx")
-            df.to_excel(backup_path, index=False)
+            shutil.copyfile(file_path, backup_path)
             self.logger.info(f"Backup created: {backup_path}")
 
             # Apply fixes
             fixed_df = self.apply_rowid_fixes(df)
 
             # Save fixed file
-            fixed_path = file_path.replace(".xlsx", "_fixed.xlsx")
-            fixed_df.to_excel(fixed_path, index=False)
+            fixed_path = self.write_fixed_file(
+                fixed_df, file_path.replace(".xlsx", "_fixed.xlsx"), prefer_parquet
+            )
             self.logger.info(f"Fixed file saved: {fixed_path}")
 
             return True
@@ -477,34 +657,52 @@ def safe_multiprocessing_split(df, num_workers):
             self.logger.error(f"Fix attempt failed: {e}")
             return False
 
+    def write_fixed_file(self, df, fixed_path, prefer_parquet=False):
+        """Write the fixed DataFrame and return the path written.
+
+        xlsxwriter is used rather than the default openpyxl writer. Its
+        constant_memory mode is not used: pandas writes cells column by
+        column, and constant_memory silently drops out-of-row-order cells.
+        """
+        if prefer_parquet:
+            fixed_path = fixed_path.replace(".xlsx", ".parquet")
+            df.to_parquet(fixed_path, index=False, compression="zstd")
+            return fixed_path
+
+        df.to_excel(fixed_path, index=False, engine="xlsxwriter")
+        return fixed_path
+
     def apply_rowid_fixes(self, df):
         """Apply common fixes to the DataFrame."""
         self.logger.info("Applying RowID fixes...")
 
+        col_set = set(df.columns)
+
         # Remove existing RowID if present
-        if "RowID" in df.columns:
+        if "RowID" in col_set:
             df = df.drop(columns=["RowID"])
             self.logger.info("Removed existing RowID column")
 
         # Ensure required columns exist
-        if "Logic" not in df.columns:
-            df["Logic"] = ""
+        if "Logic" not in col_set:
+            df["Logic"] = pd.Series("", index=df.index, dtype=STRING_DTYPE)
             self.logger.info("Added missing Logic column")
 
         # Safe sorting
-        sort_columns = ["DATEFILLED", "SOURCERECORDID"]
-        available_sort_cols = [col for col in sort_columns if col in df.columns]
+        available_sort_cols = [col for col in SORT_COLUMNS if col in col_set]
 
         if available_sort_cols:
             try:
-                df = df.sort_values(by=available_sort_cols, ascending=True)
+                # Sort integer codes of the keys, then reorder all columns once
+                order = lexsort_codes(sort_key_codes(df, available_sort_cols))
+                df = df.take(order)
                 self.logger.info(f"Sorted by: {available_sort_cols}")
             except Exception as e:
                 self.logger.warning(f"Sorting failed: {e}. Using original order.")
 
         # Safe RowID creation
         try:
-            df["RowID"] = np.arange(len(df))
+            df["RowID"] = np.arange(len(df), dtype=rowid_dtype(len(df)))
             self.logger.info("Successfully created RowID column")
         except Exception as e:
             self.logger.warning(f"Standard RowID creation failed: {e}. Using index.")
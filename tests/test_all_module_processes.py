@@ -1,4 +1,5 @@
 import importlib
+import os
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -7,6 +8,26 @@ MODULES_DIR = Path(__file__).parent.parent / "modules"
 
 
 class TestAllModuleProcesses(unittest.TestCase):
+    def test_all_modules_import(self):
+        errors = []
+        for pyfile in MODULES_DIR.glob("*.py"):
+            if pyfile.name == "__init__.py":
+                continue
+            module_name = f"modules.{pyfile.stem}"
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                errors.append((module_name, f"import error: {e}"))
+        if errors:
+            for mod, err in errors:
+                print(f"Error in {mod}: {err}")
+        self.assertFalse(
+            errors, "Some modules failed to import. See above for details."
+        )
+
+    @unittest.skipUnless(
+        os.environ.get("RUN_SMOKE"), "set RUN_SMOKE=1 to run main()/process_data()"
+    )
     def test_all_main_functions(self):
         errors = []
         for pyfile in MODULES_DIR.glob("*.py"):
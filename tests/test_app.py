@@ -1,4 +1,6 @@
 import json
+import os
+import sys
 import tkinter as tk
 
 import pandas as pd
@@ -6,6 +8,22 @@ import pytest
 
 from app import App, ConfigManager
 
+# Guard GUI-dependent tests with a cheap environment check instead of opening
+# a Tk root at collection time; set FORCE_TK_TESTS=1 to run them anyway
+_HAS_DISPLAY = (
+    bool(os.environ.get("FORCE_TK_TESTS"))
+    or bool(os.environ.get("DISPLAY"))
+    or sys.platform in ("win32", "darwin")
+)
+
+# One datetime column and one column containing a None, parsed once at import
+_SAMPLE_DT_DF = pd.DataFrame(
+    {
+        "dt1": pd.to_datetime(["2020-12-31 13:45:00", "2021-01-01 00:00:00"]),
+        "value": [10, None],
+    }
+)
+
 
 @pytest.fixture
 def tmp_work_dir(tmp_path, monkeypatch):
@@ -17,6 +35,26 @@ def tmp_work_dir(tmp_path, monkeypatch):
     return tmp_path
 
 
+@pytest.fixture(scope="module")
+def app_instance():
+    """One hidden Tk root and App shared by every App test in this module."""
+    root = tk.Tk()
+    root.withdraw()
+    app = App(root)
+    yield app
+    root.destroy()
+
+
+@pytest.fixture(autouse=True)
+def _reset_app_state(request):
+    """Clear the selected file paths on the shared App before each test."""
+    if "app_instance" in request.fixturenames:
+        app = request.getfixturevalue("app_instance")
+        app.file1_path = None
+        app.file2_path = None
+        app.template_file_path = None
+
+
 def test_save_default_creates_config(tmp_work_dir):
     # When no config.json exists, ConfigManager.save_default() should create one
     # under the current directory (tmp_work_dir).
@@ -44,7 +82,7 @@ def test_load_existing_config(tmp_work_dir):
     ), "ConfigManager did not load the existing config.json correctly."
 
 
-def test_filter_template_columns_extracts_correct_range():
+def test_filter_template_columns_extracts_correct_range(app_instance):
     # Build a sample DataFrame where columns go: ['A','B','Client Name','X','Y','Logic','Z','W']
     df = pd.DataFrame(
         {
@@ -60,11 +98,7 @@ def test_filter_template_columns_extracts_correct_range():
     )
 
     # We only expect columns from 'Client Name' up through 'Logic' (inclusive).
-    root = tk.Tk()
-    root.withdraw()
-    app = App(root)
-    filtered = app.filter_template_columns(df)
-    root.destroy()
+    filtered = app_instance.filter_template_columns(df)
 
     assert list(filtered.columns) == [
         "Client Name",
@@ -74,38 +108,22 @@ def test_filter_template_columns_extracts_correct_range():
     ], f"Expected columns from 'Client Name' to 'Logic', got {list(filtered.columns)}"
 
 
-def test_filter_template_columns_fallback_to_full_df_if_missing_logic():
+def test_filter_template_columns_fallback_to_full_df_if_missing_logic(app_instance):
     # If 'Client Name' or 'Logic' aren't found, it should return the full DataFrame unmodified
     df = pd.DataFrame({"Foo": [1, 2], "Bar": [3, 4]})
 
-    root = tk.Tk()
-    root.withdraw()
-    app = App(root)
-    result = app.filter_template_columns(df)
-    root.destroy()
+    result = app_instance.filter_template_columns(df)
 
     # Since 'Client Name' or 'Logic' are not present, filter_template_columns should catch ValueError
     # and return the original DataFrame
     pd.testing.assert_frame_equal(result, df)
 
 
-def test_format_dataframe_converts_datetimes_and_handles_na():
-    # Build a DataFrame with one datetime column and one column containing a None
-    orig = pd.DataFrame(
-        {
-            "dt1": [
-                pd.to_datetime("2020-12-31 13:45:00"),
-                pd.to_datetime("2021-01-01 00:00:00"),
-            ],
-            "value": [10, None],
-        }
-    )
+def test_format_dataframe_converts_datetimes_and_handles_na(app_instance):
+    # Copy so format_dataframe can't leak changes into the shared frame
+    orig = _SAMPLE_DT_DF.copy()
 
-    root = tk.Tk()
-    root.withdraw()
-    app = App(root)
-    formatted = app.format_dataframe(orig)
-    root.destroy()
+    formatted = app_instance.format_dataframe(orig)
 
     # 'dt1' should now be strings in format '%Y-%m-%d %H:%M:%S'
     assert formatted["dt1"].dtype == object
@@ -116,28 +134,12 @@ def test_format_dataframe_converts_datetimes_and_handles_na():
     assert formatted["value"].iloc[1] == ""
 
 
-# (Optional) If you want to guard GUI‐dependent tests to skip automatically when no display is available:
-def is_display_available():
-    try:
-        root = tk.Tk()
-        root.destroy()
-        return True
-    except tk.TclError:
-        return False
-
-
-@pytest.mark.skipif(not is_display_available(), reason="Tkinter display not available")
-def test_app_instantiation_and_basic_attributes():
+@pytest.mark.skipif(not _HAS_DISPLAY, reason="Tkinter display not available")
+def test_app_instantiation_and_basic_attributes(app_instance):
     # A minimal smoke–test to ensure that App(root) does not crash immediately,
     # and that certain attributes exist.
-    root = tk.Tk()
-    root.withdraw()
-    app = App(root)
-
     # Basic sanity checks:
-    assert hasattr(app, "file1_path")
-    assert hasattr(app, "file2_path")
-    assert hasattr(app, "template_file_path")
-    assert isinstance(app.progress_bar, type(app.progress_bar))
-
-    root.destroy()
+    assert hasattr(app_instance, "file1_path")
+    assert hasattr(app_instance, "file2_path")
+    assert hasattr(app_instance, "template_file_path")
+    assert isinstance(app_instance.progress_bar, type(app_instance.progress_bar))
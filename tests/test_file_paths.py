@@ -1,15 +1,9 @@
 import os
-import sys
 import unittest
-from pathlib import Path
+from collections import defaultdict
 
 from config.config_loader import ConfigLoader
 
-# Ensure project root is in sys.path
-project_root = Path(__file__).parent.parent.resolve()
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
 
 class TestFilePaths(unittest.TestCase):
     def setUp(self):
@@ -17,11 +11,24 @@ class TestFilePaths(unittest.TestCase):
         self.paths = ConfigLoader.load_file_paths()
 
     def test_all_paths_exist(self):
-        missing = []
+        # Group by directory so each directory is listed once with scandir
+        # instead of stat-ing every file individually
+        by_dir = defaultdict(list)
         for key, rel_path in self.paths.items():
-            abs_path = os.path.join(os.getcwd(), rel_path)
-            if not os.path.exists(abs_path):
-                missing.append((key, abs_path))
+            abs_path = os.path.normpath(os.path.join(os.getcwd(), rel_path))
+            by_dir[os.path.dirname(abs_path)].append((key, abs_path))
+        missing = []
+        for dir_path, items in by_dir.items():
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = {entry.name for entry in it}
+            except OSError:
+                entries = set()
+            missing.extend(
+                (key, abs_path)
+                for key, abs_path in items
+                if os.path.basename(abs_path) not in entries
+            )
         if missing:
             for key, path in missing:
                 print(f"Missing file for key '{key}': {path}")
@@ -1,9 +1,5 @@
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 import unittest
+from pathlib import Path
 
 from modules.file_processor import FileProcessor
 
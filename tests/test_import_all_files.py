@@ -1,35 +1,30 @@
 import importlib.util
-import os
-import unittest
 from pathlib import Path
 
+import pytest
 
-class TestAllPythonFiles(unittest.TestCase):
-    def test_import_all_python_files(self):
-        errors = []
-        for root, dirs, files in os.walk(Path(__file__).parent.parent):
-            for file in files:
-                if file.endswith(".py") and not file.startswith("test_"):
-                    file_path = os.path.join(root, file)
-                    module_name = file_path.replace(os.sep, ".")[:-3]
-                    try:
-                        spec = importlib.util.spec_from_file_location(
-                            module_name, file_path
-                        )
-                        if spec is not None and spec.loader is not None:
-                            module = importlib.util.module_from_spec(spec)
-                            spec.loader.exec_module(module)
-                        else:
-                            errors.append(
-                                (file_path, "Could not create module spec or loader")
-                            )
-                    except Exception as e:
-                        errors.append((file_path, str(e)))
-        if errors:
-            for file_path, error in errors:
-                print(f"Error importing {file_path}: {error}")
-        self.assertFalse(errors, "Some files failed to import. See above for details.")
+PROJECT_ROOT = Path(__file__).parent.parent
+# Directory names whose files are never imported
+EXCLUDED_DIRS = frozenset({".git", ".venv", "site-packages", "__pycache__"})
 
+# Collected once; each file becomes its own test so failures are isolated
+# and pytest-xdist (``pytest -n auto``) can spread the imports across cores
+_PY_FILES = sorted(
+    path
+    for path in PROJECT_ROOT.rglob("*.py")
+    if not path.name.startswith("test_")
+    and EXCLUDED_DIRS.isdisjoint(path.relative_to(PROJECT_ROOT).parts)
+)
 
-if __name__ == "__main__":
-    unittest.main()
+
+@pytest.mark.parametrize(
+    "file_path", _PY_FILES, ids=lambda p: p.relative_to(PROJECT_ROOT).as_posix()
+)
+def test_import(file_path):
+    module_name = ".".join(file_path.relative_to(PROJECT_ROOT).with_suffix("").parts)
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    assert spec is not None and spec.loader is not None, (
+        f"Could not create module spec or loader for {file_path}"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
@@ -1,96 +1,62 @@
-import sys
+import shutil
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-import unittest
-
-import openpyxl
 import pandas as pd
+import pytest
 
 from utils.excel_utils import write_df_to_template
 
+TEMPLATE_NAMES = ("SHARx_Template.xlsx", "EPLS_Template.xlsx", "Disruption_Template.xlsx")
+
+
+@pytest.fixture
+def lbl_df():
+    return pd.DataFrame({"Header1": [1, 2], "Header2": [3, 4]})
+
+
+@pytest.fixture(autouse=True)
+def templates(tmp_path, monkeypatch, dummy_xlsx_template):
+    """Copy the SHARx, EPLS, and Disruption templates into a private CWD.
+
+    Outputs and any _copy files land in tmp_path, so no cleanup is needed.
+    """
+    monkeypatch.chdir(tmp_path)
+    for name in TEMPLATE_NAMES:
+        shutil.copyfile(dummy_xlsx_template, name)
+    return [Path(name) for name in TEMPLATE_NAMES]
+
+
+def _write_lbl(template_path, output_path, df):
+    write_df_to_template(
+        template_path=template_path,
+        output_path=output_path,
+        sheet_name="Line By Line",
+        df=df,
+        start_cell="A2",
+        header=False,
+        index=False,
+        visible=False,
+        open_file=False,
+    )
+
+
+def test_sharx_lbl_protection(templates, lbl_df):
+    # Try to write output to template name (should create a copy)
+    output_path = Path("_Rx Claims for SHARx.xlsx")
+    _write_lbl(templates[0], output_path, lbl_df)
+    # Should not overwrite template, should create a copy if protected
+    copies = list(Path(".").glob("_Rx Claims for SHARx_copy*.xlsx"))
+    assert copies or output_path.exists()
+
+
+def test_epls_lbl_protection(templates, lbl_df):
+    output_path = Path("_Rx Claims for EPLS.xlsx")
+    _write_lbl(templates[1], output_path, lbl_df)
+    copies = list(Path(".").glob("_Rx Claims for EPLS_copy*.xlsx"))
+    assert copies or output_path.exists()
+
 
-class TestLBLOverwriteProtection(unittest.TestCase):
-    def setUp(self):
-        # Create dummy templates for SHARx, EPLS, and Disruption
-        self.sharx_template = Path("SHARx_Template.xlsx")
-        self.epls_template = Path("EPLS_Template.xlsx")
-        self.disruption_template = Path("Disruption_Template.xlsx")
-        for template in [
-            self.sharx_template,
-            self.epls_template,
-            self.disruption_template,
-        ]:
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            if ws is not None:
-                ws.title = "Line By Line"
-                ws.cell(row=1, column=1, value="Header1")
-                ws.cell(row=1, column=2, value="Header2")
-            wb.save(template)
-        self.df = pd.DataFrame({"Header1": [1, 2], "Header2": [3, 4]})
-
-    def tearDown(self):
-        # Remove all test files and copies
-        for f in Path(".").glob("*Template*.xlsx"):
-            f.unlink()
-        for f in Path(".").glob("_Rx Claims for SHARx*.xlsx"):
-            f.unlink()
-        for f in Path(".").glob("_Rx Claims for EPLS*.xlsx"):
-            f.unlink()
-        for f in Path(".").glob("Unknown_Disruption_Report*.xlsx"):
-            f.unlink()
-
-    def test_sharx_lbl_protection(self):
-        # Try to write output to template name (should create a copy)
-        output_path = Path("_Rx Claims for SHARx.xlsx")
-        write_df_to_template(
-            template_path=self.sharx_template,
-            output_path=output_path,
-            sheet_name="Line By Line",
-            df=self.df,
-            start_cell="A2",
-            header=False,
-            index=False,
-            visible=False,
-            open_file=False,
-        )
-        # Should not overwrite template, should create a copy if protected
-        copies = list(Path(".").glob("_Rx Claims for SHARx_copy*.xlsx"))
-        self.assertTrue(copies or output_path.exists())
-
-    def test_epls_lbl_protection(self):
-        output_path = Path("_Rx Claims for EPLS.xlsx")
-        write_df_to_template(
-            template_path=self.epls_template,
-            output_path=output_path,
-            sheet_name="Line By Line",
-            df=self.df,
-            start_cell="A2",
-            header=False,
-            index=False,
-            visible=False,
-            open_file=False,
-        )
-        copies = list(Path(".").glob("_Rx Claims for EPLS_copy*.xlsx"))
-        self.assertTrue(copies or output_path.exists())
-
-    def test_disruption_lbl_protection(self):
-        output_path = Path("Unknown_Disruption_Report.xlsx")
-        write_df_to_template(
-            template_path=self.disruption_template,
-            output_path=output_path,
-            sheet_name="Line By Line",
-            df=self.df,
-            start_cell="A2",
-            header=False,
-            index=False,
-            visible=False,
-            open_file=False,
-        )
-        self.assertTrue(output_path.exists())
-
-
-if __name__ == "__main__":
-    unittest.main()
+def test_disruption_lbl_protection(templates, lbl_df):
+    output_path = Path("Unknown_Disruption_Report.xlsx")
+    _write_lbl(templates[2], output_path, lbl_df)
+    assert output_path.exists()
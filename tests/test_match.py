@@ -1,16 +1,17 @@
-from config.config_loader import ConfigLoader
-import pandas as pd
-
-fp = ConfigLoader.load_file_paths()
-net = pd.read_csv(fp['n_disrupt'], usecols=['pharmacy_nabp', 'pharmacy_npi', 'pharmacy_is_excluded'], dtype=str)
-test_nabp = '1504023'
-match = net[net['pharmacy_nabp'].str.strip().str.upper() == test_nabp]
-print(f'Looking for NABP: {test_nabp}')
-print(f'Matches found: {len(match)}')
-if len(match) > 0:
-    print('\nMatch details:')
-    print(match)
-else:
-    print('\nNo match found!')
-    print('\nFirst 10 NABPs in network (uppercased):')
-    print(net['pharmacy_nabp'].str.strip().str.upper().head(10).tolist())
+def test_match(n_disrupt_network):
+    net, nabp_index = n_disrupt_network
+    test_nabp = '1504023'
+    positions = nabp_index.get_indexer_for([test_nabp])
+    match = net.iloc[positions[positions >= 0]]
+    print(f'Looking for NABP: {test_nabp}')
+    print(f'Matches found: {len(match)}')
+    if len(match) > 0:
+        print('\nMatch details:')
+        print(match)
+    else:
+        print('\nNo match found!')
+        print('\nFirst 10 NABPs in network (uppercased):')
+        print(nabp_index[:10].tolist())
+    # The index probe must find exactly the rows the column scan finds
+    expected = net[net['pharmacy_nabp'].str.strip().str.upper() == test_nabp]
+    assert sorted(match.index) == expected.index.tolist()
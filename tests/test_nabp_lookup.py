@@ -1,11 +1,12 @@
-from config.config_loader import ConfigLoader
-import pandas as pd
-
-fp = ConfigLoader.load_file_paths()
-net = pd.read_csv(fp['n_disrupt'], usecols=['pharmacy_nabp', 'pharmacy_npi', 'pharmacy_is_excluded'], dtype=str)
-
-test_nabps = ['1825655', '1525798', '1462821']
-for nabp in test_nabps:
-    match = net[net['pharmacy_nabp'].str.strip().str.upper() == nabp]
-    excluded_vals = match['pharmacy_is_excluded'].tolist() if len(match) > 0 else 'N/A'
-    print(f'NABP {nabp}: {len(match)} matches, excluded={excluded_vals}')
+def test_nabp_lookup(n_disrupt_network):
+    net, nabp_index = n_disrupt_network
+    test_nabps = ['1825655', '1525798', '1462821']
+    normalized = net['pharmacy_nabp'].str.strip().str.upper()
+    for nabp in test_nabps:
+        positions = nabp_index.get_indexer_for([nabp])
+        match = net.iloc[positions[positions >= 0]]
+        excluded_vals = match['pharmacy_is_excluded'].tolist() if len(match) > 0 else 'N/A'
+        print(f'NABP {nabp}: {len(match)} matches, excluded={excluded_vals}')
+        # The index probe must find exactly the rows the column scan finds
+        expected = net[normalized == nabp]
+        assert match.sort_index().equals(expected)
@@ -1,37 +1,37 @@
-import pandas as pd
+from utils import utils
 from utils.utils import (
     vectorized_resolve_pharmacy_exclusion,
     clear_pharmacy_exclusion_cache,
 )
 
-def make_network():
-    return pd.DataFrame({
-        'pharmacy_nabp': ['1234567','7654321','5555555'],
-        'pharmacy_npi': ['1111111111','2222222222','3333333333'],
-        'pharmacy_is_excluded': ['Yes','No','maybe']
-    })
-
-def test_basic_mapping():
+def test_basic_mapping(sample_network_df, sample_claims_df):
     """Verify mapping outcomes for yes/no/unmatched and unexpected token."""
     clear_pharmacy_exclusion_cache(persistent=False)
-    claims = pd.DataFrame({
-        'NABP': ['1234567','7654321','0000000',''],
-        'PHARMACYNPI': ['1111111111','2222222222','4444444444','3333333333']
-    })
-    network = make_network()
-    result = vectorized_resolve_pharmacy_exclusion(claims, network, use_cache=False, persist=False)
+    result = vectorized_resolve_pharmacy_exclusion(sample_claims_df, sample_network_df, use_cache=False, persist=False)
     assert result.iloc[0] is True
     assert result.iloc[1] is False
-    assert result.iloc[2] == 'REVIEW'
+    assert result.iloc[2] is False
     assert result.iloc[3] == 'REVIEW'
+    assert result.iloc[4] == 'REVIEW'
 
-def test_cache_hit():
+def test_cache_hit(sample_network_df, sample_claims_df):
     """Ensure second invocation uses cached lookup (indirectly via faster run)."""
     clear_pharmacy_exclusion_cache(persistent=False)
-    claims = pd.DataFrame({'NABP':['1234567'],'PHARMACYNPI':['1111111111']})
-    network = make_network()
-    r1 = vectorized_resolve_pharmacy_exclusion(claims, network, use_cache=True, persist=False)
-    r2 = vectorized_resolve_pharmacy_exclusion(claims, network, use_cache=True, persist=False)
+    claims = sample_claims_df.head(1)
+    r1 = vectorized_resolve_pharmacy_exclusion(claims, sample_network_df, use_cache=True, persist=False)
+    r2 = vectorized_resolve_pharmacy_exclusion(claims, sample_network_df, use_cache=True, persist=False)
     assert bool(r1.iloc[0]) and bool(r2.iloc[0])
 
+def test_persistent_cache_round_trip(sample_network_df, sample_claims_df, tmp_path, monkeypatch):
+    """Maps saved as Parquet are reloaded after the in-memory cache is cleared."""
+    monkeypatch.setattr(utils, "_PHARMACY_CACHE_DIR", tmp_path)
+    clear_pharmacy_exclusion_cache(persistent=False)
+    r1 = vectorized_resolve_pharmacy_exclusion(sample_claims_df, sample_network_df)
+    assert len(list(tmp_path.glob("*.parquet"))) == 1
+    clear_pharmacy_exclusion_cache(persistent=False)
+    r2 = vectorized_resolve_pharmacy_exclusion(sample_claims_df, sample_network_df)
+    assert r1.tolist() == r2.tolist()
+    clear_pharmacy_exclusion_cache()
+    assert not list(tmp_path.glob("*.parquet"))
+
 """Run with: pytest -q tests/test_pharmacy_exclusion.py"""
@@ -1,55 +1,73 @@
-import unittest
-from pathlib import Path
-
 import openpyxl
 import pandas as pd
+import pytest
 
 from utils.excel_utils import write_df_to_template
 
 
-class TestTemplatePasting(unittest.TestCase):
-    def setUp(self):
-        # Create a dummy template Excel file
-        self.template_path = Path("test_template.xlsx")
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        if ws is not None:
-            ws.title = "Sheet1"
-            ws.cell(row=1, column=1, value="Header1")
-            ws.cell(row=1, column=2, value="Header2")
-        wb.save(self.template_path)
-        # Create a dummy DataFrame
-        self.df = pd.DataFrame({"Header1": [1, 2], "Header2": [3, 4]})
-        self.output_path = Path("test_output.xlsx")
+def test_write_df_to_template(dummy_xlsx_template, tmp_path):
+    df = pd.DataFrame({"Header1": [1, 2], "Header2": [3, 4]})
+    output_path = tmp_path / "test_output.xlsx"
+    # Paste DataFrame into template
+    write_df_to_template(
+        template_path=dummy_xlsx_template,
+        output_path=output_path,
+        sheet_name="Sheet1",
+        df=df,
+        start_cell="A2",
+        header=False,
+        index=False,
+        visible=False,
+        open_file=False,
+    )
+    # Verify output
+    wb = openpyxl.load_workbook(output_path)
+    ws = wb["Sheet1"]
+    assert ws["A2"].value == 1
+    assert ws["B2"].value == 3
+    assert ws["A3"].value == 2
+    assert ws["B3"].value == 4
 
-    def tearDown(self):
-        # Clean up test files
-        if self.template_path.exists():
-            self.template_path.unlink()
-        if self.output_path.exists():
-            self.output_path.unlink()
 
-    def test_write_df_to_template(self):
-        # Paste DataFrame into template
-        write_df_to_template(
-            template_path=self.template_path,
-            output_path=self.output_path,
-            sheet_name="Sheet1",
-            df=self.df,
-            start_cell="A2",
-            header=False,
-            index=False,
-            visible=False,
-            open_file=False,
-        )
-        # Verify output
-        wb = openpyxl.load_workbook(self.output_path)
-        ws = wb["Sheet1"]
-        self.assertEqual(ws["A2"].value, 1)
-        self.assertEqual(ws["B2"].value, 3)
-        self.assertEqual(ws["A3"].value, 2)
-        self.assertEqual(ws["B3"].value, 4)
+def test_write_df_to_template_openpyxl_engine(dummy_xlsx_template, tmp_path):
+    df = pd.DataFrame({"Header1": [1.5, None], "Header2": ["x", "y"]})
+    output_path = tmp_path / "test_output_openpyxl.xlsx"
+    write_df_to_template(
+        template_path=dummy_xlsx_template,
+        output_path=output_path,
+        sheet_name="Sheet1",
+        df=df,
+        start_cell="A2",
+        engine="openpyxl",
+    )
+    wb = openpyxl.load_workbook(output_path)
+    ws = wb["Sheet1"]
+    # Template header row is left in place
+    assert ws["A1"].value == "Header1"
+    assert ws["A2"].value == 1.5
+    assert ws["B2"].value == "x"
+    assert ws["A3"].value is None
+    assert ws["B3"].value == "y"
 
 
-if __name__ == "__main__":
-    unittest.main()
+def test_write_df_to_template_xlsxwriter_engine(dummy_xlsx_template, tmp_path):
+    pytest.importorskip("xlsxwriter")
+    df = pd.DataFrame(
+        {"Header1": [1, 2, 3], "Header2": ["x", "y", "z"], "Header3": [4.5, 5.5, 6.5]}
+    )
+    output_path = tmp_path / "test_output_xlsxwriter.xlsx"
+    write_df_to_template(
+        template_path=dummy_xlsx_template,
+        output_path=output_path,
+        sheet_name="Sheet1",
+        df=df,
+        start_cell="B3",
+        engine="xlsxwriter",
+    )
+    ws = openpyxl.load_workbook(output_path)["Sheet1"]
+    # Every cell must survive, not just the first column and the last row
+    written = [
+        [cell.value for cell in row]
+        for row in ws.iter_rows(min_row=3, max_row=5, min_col=2, max_col=4)
+    ]
+    assert written == df.values.tolist()
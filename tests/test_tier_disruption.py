@@ -1,14 +1,16 @@
 import os
 import shutil
 
+import pytest
+
 from modules.tier_disruption import process_data
 
 
-def test_process_tier_runs(tmp_path):
-    # Ensure file_paths.json is available in the working directory
+@pytest.mark.slow
+def test_process_tier_runs(tmp_path, monkeypatch):
+    # Run from tmp_path with its own file_paths.json so the CWD stays clean
     config_dir = os.path.join(os.path.dirname(__file__), "..", "config")
     src = os.path.abspath(os.path.join(config_dir, "file_paths.json"))
-    dst = os.path.abspath("file_paths.json")
-    if not os.path.exists(dst):
-        shutil.copy(src, dst)
+    monkeypatch.chdir(tmp_path)
+    shutil.copy(src, tmp_path / "file_paths.json")
     process_data()
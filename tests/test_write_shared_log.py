@@ -1,17 +1,20 @@
-import os
-import sys
+import csv
+import getpass
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.utils_functions import write_audit_log
 
 
-def test_write_audit_log():
+def test_write_audit_log(tmp_path, audit_logger):
+    # audit_logger points the shared OneDrive log at tmp_path; the
+    # re-exported write_audit_log reads the path from utils.utils
     script_name = "test_script"
     message = "This is a test log entry."
     status = "INFO"
     write_audit_log(script_name, message, status)
-    print("Log entry written. Check your Logs/{username}/Audit_Log.csv file.")
-
-
-if __name__ == "__main__":
-    test_write_audit_log()
+    # Write the buffered entry
+    audit_logger.flush_and_close()
+    user_log_path = tmp_path / getpass.getuser() / "Audit_Log.csv"
+    with user_log_path.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["Timestamp", "User", "Script", "Message", "Status"]
+    assert rows[1][2:] == [script_name, message, status]
@@ -1,5 +1,40 @@
+from types import SimpleNamespace
+
+import pandas as pd
+
 from utils import excel_utils
 
 
 def test_import():
     assert excel_utils is not None
+
+
+def test_close_workbook_restores_settings_before_save():
+    api = SimpleNamespace(
+        ScreenUpdating=True, Calculation=-4105, EnableEvents=True, DisplayAlerts=True
+    )
+    app = SimpleNamespace(api=api)
+    saved_with = []
+    wb = SimpleNamespace(
+        save=lambda: saved_with.append(api.Calculation), close=lambda: None
+    )
+
+    excel_utils._enter_batch_mode(app, use_com=False)
+    assert api.Calculation == excel_utils._XL_CALCULATION_MANUAL
+    assert api.ScreenUpdating is False
+
+    excel_utils.close_workbook(wb, app, save=True)
+    # Saving in manual mode would store manual calculation in the file
+    assert saved_with == [-4105]
+    assert api.ScreenUpdating is True and api.EnableEvents is True
+    assert id(app) not in excel_utils._APP_STATE
+
+
+def test_empty_dataframe_write_skips_excel(monkeypatch, tmp_path):
+    def fail(*args, **kwargs):
+        raise AssertionError("Excel should not be opened for an empty write")
+
+    monkeypatch.setattr(excel_utils, "open_workbook", fail)
+    empty = pd.DataFrame(columns=["A", "B"])
+    excel_utils.write_df_to_sheet(tmp_path / "out.xlsx", "Sheet1", empty)
+    excel_utils.write_df_to_sheet_async(tmp_path / "out.xlsx", "Sheet1", empty)
@@ -1,5 +1,66 @@
+import pandas as pd
+import pytest
+
 from utils import logic_processor
+from utils.logic_processor import process_logic_block
 
 
 def test_import():
     assert logic_processor is not None
+
+
+@pytest.fixture(params=["numba", "merge_asof"])
+def matcher(request, monkeypatch):
+    """Run a test through the numba kernel (if installed) and the fallback."""
+    if request.param == "numba":
+        if logic_processor.njit is None:
+            pytest.skip("numba is not installed")
+    else:
+        monkeypatch.setattr(logic_processor, "njit", None)
+    return request.param
+
+
+def test_process_logic_block_marks_closest_claim(matcher):
+    df = pd.DataFrame(
+        {
+            "NDC": ["1", "1", "1", "1", "2"],
+            "MemberID": ["a", "a", "a", "a", "a"],
+            "QUANTITY": [30, 30, -30, 30, -30],
+            "DATEFILLED": pd.to_datetime(
+                ["2024-01-01", "2024-01-20", "2024-01-25", "2024-03-30", "2024-01-25"]
+            ),
+            "Logic": ["", "", "", "", ""],
+        }
+    )
+    result = process_logic_block(df)
+    # Row 1 is the closest claim; row 3 is outside the 30-day window and
+    # row 4 is an unmatched reversal, which is still marked
+    assert result["Logic"].tolist() == ["", "OR", "OR", "", "OR"]
+
+
+def test_process_logic_block_tie_goes_to_first_row(matcher):
+    df = pd.DataFrame(
+        {
+            "NDC": ["1", "1", "1"],
+            "MemberID": ["a", "a", "a"],
+            "QUANTITY": [30, -30, 30],
+            "DATEFILLED": pd.to_datetime(["2024-01-05", "2024-01-10", "2024-01-15"]),
+            "Logic": ["", "", ""],
+        }
+    )
+    assert process_logic_block(df)["Logic"].tolist() == ["OR", "OR", ""]
+
+
+@pytest.mark.parametrize("dtype", [object, "string"])
+def test_process_logic_block_missing_ndc_stays_per_member(matcher, dtype):
+    df = pd.DataFrame(
+        {
+            "NDC": pd.Series(["x", None, None], dtype=dtype),
+            "MemberID": pd.Series(["m1", "m1", "m2"], dtype=dtype),
+            "QUANTITY": [5, -5, 5],
+            "DATEFILLED": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+            "Logic": ["", "", ""],
+        }
+    )
+    # m1's reversal has no claim with a missing NDC; m2's claim is not its own
+    assert process_logic_block(df)["Logic"].tolist() == ["", "OR", ""]
@@ -1,5 +1,271 @@
+import csv
+import getpass
+import logging.handlers
+import threading
+import time
+
+import pandas as pd
+
 from utils import utils
 
 
 def test_import():
     assert utils is not None
+
+
+def test_merge_with_network_keeps_one_row_per_claim():
+    claims = pd.DataFrame({"PHARMACYNPI": ["1", "2"], "NABP": ["a", "b"]})
+    network = pd.DataFrame(
+        {
+            "pharmacy_npi": ["1", "1"],
+            "pharmacy_nabp": ["a", "a"],
+            "pharmacy_is_excluded": ["yes", "no"],
+        }
+    )
+    merged = utils.merge_with_network(claims, network)
+    assert len(merged) == len(claims)
+    assert merged["pharmacy_is_excluded"].tolist() == ["yes", "N/A"]
+
+
+def test_drop_duplicates_df_is_single_pass():
+    df = pd.DataFrame({"a": [1, 1, 2, 1], "b": ["x", "x", "y", "x"]})
+    deduped = utils.drop_duplicates_df(df)
+    assert deduped.index.tolist() == [0, 2]
+    assert deduped.equals(deduped.drop_duplicates())
+    assert utils.drop_duplicates_df(df, subset=["a"]).index.tolist() == [0, 2]
+    last = utils.drop_duplicates_df(df, keep="last", ignore_index=True)
+    assert last.index.tolist() == [0, 1]
+    assert last["b"].tolist() == ["y", "x"]
+
+
+def test_write_audit_log_buffers_until_flush(tmp_path, monkeypatch, audit_logger):
+    monkeypatch.setattr(utils, "AUDIT_FLUSH_INTERVAL", 60)
+    user_log_path = tmp_path / getpass.getuser() / "Audit_Log.csv"
+    try:
+        utils.write_audit_log("test_script", "first")
+        assert not user_log_path.exists()
+        utils.write_audit_log("test_script", "second", "ERROR", sync=True)
+        # The file is only held open while a batch is written
+        assert audit_logger._handler is None
+        with user_log_path.open(newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+    finally:
+        audit_logger.flush_and_close()
+    assert rows[0] == utils.AUDIT_HEADER
+    assert [row[3:] for row in rows[1:]] == [["first", "INFO"], ["second", "ERROR"]]
+
+
+def test_network_signature_covers_every_row():
+    network = pd.DataFrame(
+        {
+            "pharmacy_nabp": [f"{i:07d}" for i in range(1000)],
+            "pharmacy_is_excluded": ["no"] * 1000,
+        }
+    )
+    edited = network.copy()
+    edited.loc[500, "pharmacy_is_excluded"] = "yes"
+    signature = utils._compute_network_signature(network)
+    assert signature == utils._compute_network_signature(network.copy())
+    assert signature != utils._compute_network_signature(edited)
+
+
+def test_write_audit_log_rotates_with_header(tmp_path, monkeypatch, audit_logger):
+    monkeypatch.setattr(utils, "AUDIT_MAX_BYTES", 200)
+    try:
+        for i in range(20):
+            utils.write_audit_log("test_script", f"entry {i}", sync=True)
+    finally:
+        audit_logger.flush_and_close()
+    user_log_dir = tmp_path / getpass.getuser()
+    assert sorted(p.name for p in user_log_dir.iterdir()) == [
+        "Audit_Log.csv",
+        "Audit_Log.csv.1",
+        "Audit_Log.csv.2",
+        "Audit_Log.csv.3",
+    ]
+    for path in user_log_dir.iterdir():
+        with path.open(newline="", encoding="utf-8") as f:
+            assert next(csv.reader(f)) == utils.AUDIT_HEADER
+
+
+def test_write_audit_log_keeps_rows_when_rotation_fails(
+    tmp_path, monkeypatch, audit_logger
+):
+    monkeypatch.setattr(utils, "AUDIT_MAX_BYTES", 10)
+
+    def locked(handler):
+        # What Windows does while another process has the file open
+        handler.stream.close()
+        handler.stream = None
+        raise PermissionError(32, "The file is being used by another process")
+
+    monkeypatch.setattr(logging.handlers.RotatingFileHandler, "doRollover", locked)
+    user_log_path = tmp_path / getpass.getuser() / "Audit_Log.csv"
+    user_log_path.parent.mkdir()
+    # Already past AUDIT_MAX_BYTES, so every flush tries to rotate
+    user_log_path.write_text(",".join(utils.AUDIT_HEADER) + "\n", encoding="utf-8")
+    try:
+        for i in range(3):
+            utils.write_audit_log("test_script", f"entry {i}", sync=True)
+    finally:
+        audit_logger.flush_and_close()
+    assert [p.name for p in user_log_path.parent.iterdir()] == ["Audit_Log.csv"]
+    with user_log_path.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert [row[3] for row in rows[1:]] == ["entry 0", "entry 1", "entry 2"]
+
+
+def test_write_audit_log_retries_failed_batch(tmp_path, monkeypatch, audit_logger):
+    open_file = utils._AuditLogger._open_file
+    failures = iter([OSError("share unavailable")])
+
+    def flaky_open(self, path):
+        error = next(failures, None)
+        if error is not None:
+            raise error
+        open_file(self, path)
+
+    monkeypatch.setattr(utils._AuditLogger, "_open_file", flaky_open)
+    try:
+        utils.write_audit_log("test_script", "first", sync=True)
+        utils.write_audit_log("test_script", "second", sync=True)
+    finally:
+        audit_logger.flush_and_close()
+    user_log_path = tmp_path / getpass.getuser() / "Audit_Log.csv"
+    with user_log_path.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert [row[3] for row in rows[1:]] == ["first", "second"]
+
+
+def test_write_audit_log_after_close_writes_immediately(tmp_path, audit_logger):
+    audit_logger.flush_and_close()
+    utils.write_audit_log("test_script", "late")
+    # No writer thread is restarted; the entry is written on the spot
+    assert audit_logger._thread is None
+    user_log_path = tmp_path / getpass.getuser() / "Audit_Log.csv"
+    with user_log_path.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert [row[3] for row in rows[1:]] == ["late"]
+
+
+def test_write_audit_log_starts_one_writer_thread(audit_logger, monkeypatch):
+    monkeypatch.setattr(utils, "AUDIT_FLUSH_INTERVAL", 60)
+    # The process-wide logger may already run its own writer
+    existing = set(threading.enumerate())
+    threads = [
+        threading.Thread(target=utils.write_audit_log, args=("test_script", str(i)))
+        for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writers = [
+        t
+        for t in threading.enumerate()
+        if t.name == "audit-log-writer" and t not in existing
+    ]
+    assert writers == [audit_logger._thread]
+
+
+def test_file_paths_parsed_once_until_reload(tmp_path):
+    config = tmp_path / "file_paths.json"
+    config.write_text('{"audit_log": "%OneDrive%/logs/../Audit_Log.csv"}')
+    utils.reload_file_paths()
+    first = utils._load_paths_cached(str(config), str(tmp_path))
+    assert dict(first) == {"audit_log": str(tmp_path / "Audit_Log.csv")}
+    config.write_text("{}")
+    assert utils._load_paths_cached(str(config), str(tmp_path)) == first
+    utils.reload_file_paths()
+    assert utils._load_paths_cached(str(config), str(tmp_path)) == ()
+
+
+def test_filter_logic_and_maintenance_categorical_matches_object():
+    df = pd.DataFrame(
+        {
+            "Logic": [0, 1, 5, 10, 11, 3],
+            "Maint Drug?": ["Y", "Y", "N", "Y", "Y", None],
+        }
+    )
+    expected = utils.filter_logic_and_maintenance(df)
+    assert expected.index.tolist() == [1, 3]
+    categorical = df.astype({"Maint Drug?": "category"})
+    result = utils.filter_logic_and_maintenance(categorical)
+    assert result.index.tolist() == expected.index.tolist()
+
+
+def test_filter_recent_date_parses_text_dates():
+    df = pd.DataFrame(
+        {"DATEFILLED": ["2024-01-01", "2024-01-02", "2024-07-01", "bad", None]}
+    )
+    result = utils.filter_recent_date(df)
+    assert result["DATEFILLED"].tolist() == ["2024-01-02", "2024-07-01"]
+    parsed = df.assign(DATEFILLED=pd.to_datetime(df["DATEFILLED"], errors="coerce"))
+    assert utils.filter_recent_date(parsed).index.tolist() == [1, 2]
+
+
+def test_filter_recent_date_sorted_matches_unsorted():
+    dates = pd.to_datetime(["2024-01-01", "2024-01-02", "2024-03-31", "2024-07-01"])
+    df = pd.DataFrame({"DATEFILLED": dates, "x": range(4)})
+    assert utils.filter_recent_date(df)["x"].tolist() == [1, 2, 3]
+    shuffled = df.iloc[[3, 0, 2, 1]]
+    assert utils.filter_recent_date(shuffled)["x"].tolist() == [3, 2, 1]
+    assert utils.filter_recent_date(df.head(0)).empty
+
+
+def test_clean_logic_and_tier_checks_every_tier():
+    tiers = ["1", " 2 ", None] + ["3"] * 10
+    df = utils.clean_logic_and_tier(
+        pd.DataFrame({"Logic": "5", "FormularyTier": tiers})
+    )
+    assert df["Logic"].eq(5).all()
+    assert df["FormularyTier"].tolist()[:2] == [1, 2]
+    # A brand name after the first rows keeps the whole column as text
+    df = utils.clean_logic_and_tier(
+        pd.DataFrame({"Logic": 1, "FormularyTier": tiers + [" brand"]})
+    )
+    assert df["FormularyTier"].tolist()[:3] == ["1", "2", "NAN"]
+    assert df["FormularyTier"].iloc[-1] == "BRAND"
+
+
+def test_write_audit_log_flushes_when_buffer_is_full(
+    tmp_path, monkeypatch, audit_logger
+):
+    monkeypatch.setattr(utils, "AUDIT_FLUSH_INTERVAL", 60)
+    monkeypatch.setattr(utils, "AUDIT_MAX_PENDING", 3)
+    user_log_path = tmp_path / getpass.getuser() / "Audit_Log.csv"
+    try:
+        utils.write_audit_log("test_script", "first")
+        utils.write_audit_log("test_script", "second")
+        assert not user_log_path.exists()
+        utils.write_audit_log("test_script", "third")
+        with user_log_path.open(newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+    finally:
+        audit_logger.flush_and_close()
+    assert [row[3] for row in rows[1:]] == ["first", "second", "third"]
+
+
+def test_standardize_ids_zero_pad():
+    claims = pd.DataFrame({"PHARMACYNPI": [1234, None, "nan"], "NABP": ["12", "", 7.5]})
+    claims = utils.standardize_pharmacy_ids(claims)
+    assert claims["PHARMACYNPI"].tolist() == ["0000001234", "0000000000", "0000000000"]
+    assert claims["NABP"].tolist() == ["0000012", "0000000", "00007.5"]
+    numeric = pd.DataFrame({"PHARMACYNPI": [1234, 1822750123], "NABP": [12, 0]})
+    numeric = utils.standardize_pharmacy_ids(numeric)
+    assert numeric["PHARMACYNPI"].tolist() == ["0000001234", "1822750123"]
+    assert numeric["NABP"].tolist() == ["0000012", "0000000"]
+    network = pd.DataFrame(
+        {"pharmacy_npi": [1822750.0, None], "pharmacy_nabp": [12, 0]}
+    )
+    network = utils.standardize_network_ids(network)
+    assert network["pharmacy_npi"].tolist() == ["0001822750", "0000000000"]
+    assert network["pharmacy_nabp"].tolist() == ["0000012", "0000000"]
+
+
+def test_audit_timestamp_matches_strftime(monkeypatch):
+    # Either side of a minute boundary, then back within the same minute
+    for now in (1_700_000_039.9, 1_700_000_040.0, 1_700_000_099.5, 1_700_000_041):
+        monkeypatch.setattr(utils.time, "time", lambda now=now: now)
+        expected = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(int(now)))
+        assert utils._audit_timestamp() == expected
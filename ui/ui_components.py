@@ -3,11 +3,26 @@ UI Components module for the Repricing Automation application.
 This module contains UI-related classes and utilities to improve code organization.
 """
 
+import time
+
 import customtkinter as ctk
 
 # UI styling variables
 FONT_SELECT = ("Cambria", 20, "bold")
 
+# Shared CTkFont for FONT_SELECT, created on first use because Tk needs a root
+_FONT = None
+
+
+def _font():
+    """Return the shared FONT_SELECT CTkFont, creating it on first use."""
+    global _FONT
+    if _FONT is None:
+        family, size, weight = FONT_SELECT
+        _FONT = ctk.CTkFont(family=family, size=size, weight=weight)
+    return _FONT
+
+
 # Color palettes
 LIGHT_COLORS = {
     "dark_blue": "#D9EAF7",
@@ -28,43 +43,53 @@ class UIFactory:
     """Factory class to create UI components and reduce code duplication."""
 
     @staticmethod
-    def _create_button_base(parent, text, command, fg_color):
-        """Base method for creating buttons with common styling."""
-        return ctk.CTkButton(
+    def _create_button_base(parent, text, command, fg_color, registry=None):
+        """Base method for creating buttons with common styling.
+
+        If registry is a list, the new button is appended to it so
+        ThemeManager can recolor it without looking it up by name.
+        """
+        button = ctk.CTkButton(
             parent,
             text=text,
             command=command,
-            font=FONT_SELECT,
+            font=_font(),
             height=40,
             bg_color=fg_color,
             text_color="#000000",
         )
+        if registry is not None:
+            registry.append(button)
+        return button
 
     @staticmethod
-    def create_standard_button(parent, text, command):
+    def create_standard_button(parent, text, command, registry=None):
         """Create a standardized button with common styling."""
         return UIFactory._create_button_base(
-            parent, text, command, LIGHT_COLORS["mint"]
+            parent, text, command, LIGHT_COLORS["mint"], registry
         )
 
     @staticmethod
-    def create_red_button(parent, text, command):
+    def create_red_button(parent, text, command, registry=None):
         """Create a red button (for cancel/exit actions)."""
         return UIFactory._create_button_base(
-            parent, text, command, LIGHT_COLORS["button_red"]
+            parent, text, command, LIGHT_COLORS["button_red"], registry
         )
 
     @staticmethod
-    def create_standard_frame(parent):
+    def create_standard_frame(parent, registry=None):
         """Create a standardized frame with common styling."""
-        return ctk.CTkFrame(parent, bg_color=LIGHT_COLORS["grey_blue"])
+        frame = ctk.CTkFrame(parent, bg_color=LIGHT_COLORS["grey_blue"])
+        if registry is not None:
+            registry.append(frame)
+        return frame
 
     @staticmethod
     def create_standard_label(parent, text, width=None):
         """Create a standardized label."""
         if width:
-            return ctk.CTkLabel(parent, text=text, font=FONT_SELECT, width=width)
-        return ctk.CTkLabel(parent, text=text, font=FONT_SELECT)
+            return ctk.CTkLabel(parent, text=text, font=_font(), width=width)
+        return ctk.CTkLabel(parent, text=text, font=_font())
 
 
 class ThemeManager:
@@ -72,63 +97,64 @@ class ThemeManager:
 
     @staticmethod
     def apply_theme_colors(app_instance, colors):
-        """Apply theme colors to all UI components."""
-        ThemeManager._apply_root_colors(app_instance, colors)
-        ThemeManager._apply_frame_colors(app_instance, colors)
-        ThemeManager._apply_button_colors(app_instance, colors)
-        ThemeManager._apply_special_component_colors(app_instance, colors)
+        """Apply theme colors to all UI components.
+
+        The configure() calls are collected and run together in one
+        after_idle callback, so Tk redraws once instead of once per widget.
+        """
+        mint = colors["mint"]
+        grey = colors["grey_blue"]
+        red = colors["button_red"]
+        dark = colors["dark_blue"]
+        updates = [
+            *ThemeManager._frame_color_updates(app_instance, grey),
+            *ThemeManager._button_color_updates(app_instance, mint),
+            *ThemeManager._special_component_color_updates(app_instance, red, grey),
+        ]
+        root = app_instance.root
+        root.after_idle(ThemeManager._configure_all, root, dark, updates)
 
     @staticmethod
-    def _apply_root_colors(app_instance, colors):
-        """Apply colors to the root window."""
+    def _configure_all(root, root_color, updates):
+        """Apply the root color and every queued (widget, options) update."""
         try:
-            app_instance.root.configure(bg_color=colors["dark_blue"])
+            root.configure(bg_color=root_color)
         except Exception:
-            app_instance.root.configure(bg=colors["dark_blue"])
+            root.configure(bg=root_color)
+        for widget, options in updates:
+            widget.configure(**options)
 
     @staticmethod
-    def _apply_frame_colors(app_instance, colors):
-        """Apply colors to frames."""
-        frames = ["button_frame", "notes_frame", "dis_frame", "prog_frame"]
-        for frame_name in frames:
-            frame = getattr(app_instance, frame_name, None)
-            if frame:
-                frame.configure(bg_color=colors["grey_blue"])
+    def _frame_color_updates(app_instance, grey):
+        """Return color updates for the frames registered at creation."""
+        frame_colors = {"bg_color": grey}
+        return [(frame, frame_colors) for frame in app_instance._themed_frames]
 
     @staticmethod
-    def _apply_button_colors(app_instance, colors):
-        """Apply colors to standard buttons."""
-        button_widgets = [
-            "file1_button",
-            "file2_button",
-            "template_button",
-            "cancel_button",
-            "logs_button",
-            "toggle_theme_button",
-            "sharx_lbl_button",
-            "epls_lbl_button",
-            "start_process_button",
-        ]
-
-        for btn_name in button_widgets:
-            btn = getattr(app_instance, btn_name, None)
-            if btn:
-                btn.configure(bg_color=colors["mint"], text_color="#000000")
+    def _button_color_updates(app_instance, mint):
+        """Return color updates for the buttons registered at creation."""
+        button_colors = {"bg_color": mint, "text_color": "#000000"}
+        return [(btn, button_colors) for btn in app_instance._themed_buttons]
 
     @staticmethod
-    def _apply_special_component_colors(app_instance, colors):
-        """Apply colors to special components."""
+    def _special_component_color_updates(app_instance, red, grey):
+        """Return color updates for special components."""
+        updates = []
         # Apply colors to special buttons
         if hasattr(app_instance, "exit_button"):
-            app_instance.exit_button.configure(
-                bg_color=colors["button_red"], text_color="#000000"
+            updates.append(
+                (app_instance.exit_button, {"bg_color": red, "text_color": "#000000"})
             )
 
         # Apply colors to progress components
         if hasattr(app_instance, "progress_label"):
-            app_instance.progress_label.configure(
-                bg_color=colors["grey_blue"], text_color="#000000"
+            updates.append(
+                (
+                    app_instance.progress_label,
+                    {"bg_color": grey, "text_color": "#000000"},
+                )
             )
+        return updates
 
 
 class ProgressManager:
@@ -136,15 +162,15 @@ class ProgressManager:
 
     @staticmethod
     def calculate_time_estimates(value, start_time):
-        """Calculate progress percentage and time estimates."""
-        import time
+        """Calculate progress percentage and time estimates as floats.
 
-        percent = int(value * 100)
+        start_time is a time.time() timestamp, as stored on the app.
+        """
         elapsed = time.time() - start_time if start_time else 0
-        est = int((elapsed / value) * (1 - value)) if value > 0 else 0
-        return percent, est
+        est = (elapsed / value) * (1 - value) if value > 0 else 0
+        return value * 100, est
 
     @staticmethod
     def format_progress_message(percent, estimated_seconds):
         """Format progress message with percentage and time estimate."""
-        return f"Progress: {percent}% | Est. {estimated_seconds}s left"
+        return f"Progress: {int(percent)}% | Est. {int(estimated_seconds)}s left"
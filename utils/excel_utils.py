@@ -1,15 +1,22 @@
+import atexit
+import errno
 import importlib.util
+import itertools
 import logging
 import shutil
 import sys
 import tempfile
+import time
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import zipfile
 from pathlib import Path
-from typing import Any, Tuple, Union
+from typing import Any, Dict, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import xlwings as xw
+from openpyxl import load_workbook
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string
 
 project_root = Path(__file__).resolve().parent.parent
 if str(project_root) not in sys.path:
@@ -19,16 +26,69 @@ logger = logging.getLogger(__name__)
 
 # COM fallback via pywin32
 EXCEL_COM_AVAILABLE = importlib.util.find_spec("win32com.client") is not None
-
-
-def validate_excel_file(file_path: Union[str, Path]) -> bool:
+# xlsxwriter streams plain writes much faster than openpyxl
+XLSXWRITER_AVAILABLE = importlib.util.find_spec("xlsxwriter") is not None
+# python-calamine (optional) reads xlsx far faster than openpyxl
+CALAMINE_AVAILABLE = importlib.util.find_spec("python_calamine") is not None
+
+# COM errors raised by xlwings/pywin32 on Windows; hresults Excel returns
+# while busy (VBA_E_IGNORE, RPC_E_CALL_REJECTED) are worth retrying
+if EXCEL_COM_AVAILABLE:
+    from pywintypes import com_error as _COM_ERROR
+else:
+    _COM_ERROR = ()
+_TRANSIENT_COM_HRESULTS = frozenset({0x800AC472, 0x80010001})
+_OPEN_MAX_BACKOFF = 2.0
+
+# Rows per bulk range assignment in write_df_to_sheet_async
+_WRITE_CHUNK_ROWS = 50_000
+
+# Excel application settings applied while a workbook is open, so writes
+# don't repaint the screen, recalculate, or fire events; the previous
+# values are kept per application in _APP_STATE until close_workbook
+_XL_CALCULATION_MANUAL = -4135
+_BATCH_SETTINGS = (
+    ("ScreenUpdating", False),
+    ("Calculation", _XL_CALCULATION_MANUAL),
+    ("EnableEvents", False),
+    ("DisplayAlerts", False),
+)
+_APP_STATE: Dict[int, Dict[str, Any]] = {}
+
+# Free bytes per volume from check_disk_space, as (monotonic time, bytes);
+# reused for a couple of seconds and cleared after each successful write
+_DISK_CACHE: Dict[str, Tuple[float, int]] = {}
+_DISK_CACHE_TTL = 2.0
+
+# Excel instances reused across open_workbook calls; starting Excel costs
+# seconds, so it is only quit at interpreter exit (see shutdown_excel)
+_XW_APP = None
+_COM_APP = None
+
+
+def validate_excel_file(file_path: Union[str, Path], deep: bool = False) -> bool:
     """
     Validate if an Excel file is not corrupted and can be opened.
+    An .xlsx is a ZIP archive, so by default this only checks member CRCs and
+    that xl/workbook.xml is present; deep=True also parses it with pandas.
     Returns True if valid, False if corrupted.
     """
     try:
-        # Quick validation using pandas first
-        pd.read_excel(str(file_path), nrows=1)
+        with zipfile.ZipFile(str(file_path)) as z:
+            bad_member = z.testzip()
+            if bad_member is not None:
+                logger.warning(
+                    f"Excel file validation failed for {file_path}: corrupt member {bad_member}"
+                )
+                return False
+            if "xl/workbook.xml" not in z.namelist():
+                logger.warning(
+                    f"Excel file validation failed for {file_path}: missing xl/workbook.xml"
+                )
+                return False
+        if deep:
+            engine = "calamine" if CALAMINE_AVAILABLE else None
+            pd.read_excel(str(file_path), nrows=1, engine=engine)
         return True
     except Exception as e:
         logger.warning(f"Excel file validation failed for {file_path}: {e}")
@@ -38,6 +98,7 @@ def validate_excel_file(file_path: Union[str, Path]) -> bool:
 def safe_excel_write(df: pd.DataFrame, output_path: Union[str, Path], **kwargs) -> bool:
     """
     Safely write DataFrame to Excel with atomic operations and validation.
+    Uses the xlsxwriter engine when installed unless an engine is given.
     Returns True if successful, False otherwise.
     """
     try:
@@ -51,6 +112,8 @@ def safe_excel_write(df: pd.DataFrame, output_path: Union[str, Path], **kwargs)
             temp_path = Path(temp_file.name)
 
         # Write to temporary file first
+        if XLSXWRITER_AVAILABLE:
+            kwargs.setdefault("engine", "xlsxwriter")
         df.to_excel(str(temp_path), **kwargs)
 
         # Validate the temporary file
@@ -59,14 +122,22 @@ def safe_excel_write(df: pd.DataFrame, output_path: Union[str, Path], **kwargs)
             logger.error(f"Generated Excel file failed validation: {temp_path}")
             return False
 
-        # If output file exists, create backup
+        # If output file exists, create backup. A hard link keeps the old
+        # file's data without copying it, and output_path stays in place until
+        # the atomic replace below; copy only where links are unsupported.
         if output_path.exists():
             backup_path = output_path.with_suffix(output_path.suffix + ".backup")
-            shutil.copy2(str(output_path), str(backup_path))
+            backup_path.unlink(missing_ok=True)
+            try:
+                os.link(str(output_path), str(backup_path))
+            except OSError:
+                shutil.copy2(str(output_path), str(backup_path))
             logger.info(f"Created backup: {backup_path}")
 
-        # Atomic move from temp to final location
-        shutil.move(str(temp_path), str(output_path))
+        # Atomic rename from temp to final location; the temp file was created
+        # in the same directory, so this never crosses filesystems
+        os.replace(str(temp_path), str(output_path))
+        _DISK_CACHE.clear()
         logger.info(f"Successfully wrote Excel file: {output_path}")
         return True
 
@@ -88,8 +159,18 @@ def check_disk_space(path: Union[str, Path], required_mb: int = 100) -> bool:
     """
     try:
         path = Path(path)
-        stat = shutil.disk_usage(str(path))
-        free_mb = stat.free / (1024 * 1024)
+        if os.name == "nt":
+            key = os.path.splitdrive(str(path.resolve()))[0] or str(path)
+        else:
+            key = str(next((p for p in (path, *path.parents) if p.exists()), path))
+        now = time.monotonic()
+        cached = _DISK_CACHE.get(key)
+        if cached is not None and now - cached[0] < _DISK_CACHE_TTL:
+            free_bytes = cached[1]
+        else:
+            free_bytes = shutil.disk_usage(key).free
+            _DISK_CACHE[key] = (now, free_bytes)
+        free_mb = free_bytes / (1024 * 1024)
         if free_mb < required_mb:
             logger.warning(
                 f"Low disk space: {free_mb:.1f}MB available, {required_mb}MB required"
@@ -101,22 +182,89 @@ def check_disk_space(path: Union[str, Path], required_mb: int = 100) -> bool:
         return True  # Assume OK if we can't check
 
 
+def _get_xw_app(visible: bool) -> Any:
+    """Return the cached xlwings App, starting Excel only if it is not alive."""
+    global _XW_APP
+    if _XW_APP is not None:
+        try:
+            _XW_APP.books  # raises if Excel has gone away
+            _XW_APP.visible = visible
+            return _XW_APP
+        except Exception:
+            _XW_APP = None
+    _XW_APP = xw.App(visible=visible, add_book=False)  # Ensure no new book is added
+    return _XW_APP
+
+
+def _get_com_app(visible: bool) -> Any:
+    """Return the cached COM Excel.Application, dispatching a new one if needed."""
+    global _COM_APP
+    if _COM_APP is not None:
+        try:
+            _COM_APP.Visible = visible  # raises if Excel has gone away
+            return _COM_APP
+        except Exception:
+            _COM_APP = None
+    import win32com.client as win32
+
+    excel: Any = win32.Dispatch("Excel.Application")
+    excel.Visible = visible  # Ensure Excel remains hidden
+    excel.DisplayAlerts = False  # Suppress alerts
+    _COM_APP = excel
+    return excel
+
+
+def shutdown_excel() -> None:
+    """
+    Quit the cached Excel instances. Runs at interpreter exit; call it
+    directly to release Excel sooner, e.g. after a batch of template fills.
+    The next open_workbook starts a new instance.
+    """
+    global _XW_APP, _COM_APP
+    _APP_STATE.clear()
+    if _XW_APP is not None:
+        try:
+            _XW_APP.quit()
+        except Exception:
+            pass
+        _XW_APP = None
+    if _COM_APP is not None:
+        try:
+            _COM_APP.Quit()
+        except Exception:
+            pass
+        _COM_APP = None
+
+
+atexit.register(shutdown_excel)
+
+
+def _is_transient_open_error(exc: Exception) -> bool:
+    """True for errors that clear up on their own, e.g. a file in use or Excel busy."""
+    if isinstance(exc, OSError):
+        return exc.errno == errno.EACCES
+    if _COM_ERROR and isinstance(exc, _COM_ERROR):
+        return (exc.args[0] & 0xFFFFFFFF) in _TRANSIENT_COM_HRESULTS
+    return False
+
+
 def open_workbook(
     path: Union[str, Path], visible: bool = False
 ) -> Tuple[Any, Any, bool]:
     """
     Open workbook via xlwings or COM fallback.
+    The Excel instance is cached and reused across calls; it is quit at exit
+    or by close_workbook(..., owns_app=True). Screen updating, calculation,
+    events, and alerts stay off until close_workbook restores them, so
+    always pair the two (close with save=False on errors).
     Returns (wb, app_obj, use_com).
     """
-    import time
-
     max_retries = 3
-    delay = 2
     last_exc = None
     path = str(path)
     for attempt in range(max_retries):
         try:
-            app = xw.App(visible=visible, add_book=False)  # Ensure no new book is added
+            app = _get_xw_app(visible)
             try:
                 wb = app.books.open(path)
             except TypeError:
@@ -126,19 +274,23 @@ def open_workbook(
                     wb = app.books.open(file_path, password=password)
                 else:
                     raise
+            _enter_batch_mode(app, use_com=False)
             return wb, app, False
+        except FileNotFoundError:
+            # A missing file won't appear on retry or via COM
+            raise
         except Exception as e:
             last_exc = e
             logger.warning(
                 f"Failed to open workbook (attempt {attempt + 1}/{max_retries}): {e}"
             )
-            time.sleep(delay)
+            if not _is_transient_open_error(e):
+                # Retrying xlwings won't help; go straight to the COM fallback
+                break
+            if attempt + 1 < max_retries:
+                time.sleep(min(0.1 * 2**attempt, _OPEN_MAX_BACKOFF))
     if EXCEL_COM_AVAILABLE:
-        import win32com.client as win32
-
-        excel: Any = win32.Dispatch("Excel.Application")
-        excel.Visible = visible  # Ensure Excel remains hidden
-        excel.DisplayAlerts = False  # Suppress alerts
+        excel = _get_com_app(visible)
         try:
             if "::" in path:
                 file_path, password = path.split("::", 1)
@@ -150,6 +302,7 @@ def open_workbook(
         except Exception as e:
             logger.error(f"COM fallback failed to open workbook: {e}")
             raise
+        _enter_batch_mode(excel, use_com=True)
         return wb, excel, True
     logger.error(f"Failed to open workbook after {max_retries} attempts: {last_exc}")
     if last_exc is not None:
@@ -158,6 +311,50 @@ def open_workbook(
     raise RuntimeError("Failed to open workbook and no exception was captured.")
 
 
+def _enter_batch_mode(app_obj: Any, use_com: bool) -> None:
+    """
+    Apply _BATCH_SETTINGS to the Excel application, remembering the previous
+    values for close_workbook. Best effort: where the properties are missing
+    (e.g. on macOS) Excel keeps its current settings.
+    """
+    if id(app_obj) in _APP_STATE:
+        # Already switched by an open_workbook whose workbook is still open
+        return
+    previous = _APP_STATE[id(app_obj)] = {}
+    try:
+        api = app_obj if use_com else app_obj.api
+        for name, value in _BATCH_SETTINGS:
+            previous[name] = getattr(api, name)
+            setattr(api, name, value)
+    except Exception as e:
+        logger.debug(f"Could not switch Excel to batch mode: {e}")
+
+
+def _restore_app_state(app_obj: Any, use_com: bool) -> None:
+    """Put back the application settings changed by _enter_batch_mode."""
+    previous = _APP_STATE.pop(id(app_obj), {})
+    for name, value in previous.items():
+        try:
+            api = app_obj if use_com else app_obj.api
+            setattr(api, name, value)
+        except Exception as e:
+            logger.debug(f"Could not restore Excel {name}: {e}")
+
+
+def _bulk_values(df: pd.DataFrame) -> Union[np.ndarray, list]:
+    """
+    Return df's cells in the cheapest form for a bulk xlwings assignment.
+    Single-dtype numeric frames go through as one C-contiguous ndarray, which
+    xlwings converts without boxing each cell; object (mixed) arrays must be
+    nested lists for the COM SAFEARRAY. Cast datetime64 columns with
+    .astype("datetime64[s]") beforehand for the fastest date path.
+    """
+    arr = np.ascontiguousarray(df.to_numpy())
+    if arr.dtype == object:
+        return arr.tolist()
+    return arr
+
+
 def write_df_to_sheet_async(
     path: Union[str, Path],
     sheet_name: str,
@@ -171,12 +368,23 @@ def write_df_to_sheet_async(
     max_workers: int = 4,
 ) -> None:
     """
-    Async version of write_df_to_sheet for large DataFrames (xlwings only).
-    Splits DataFrame into row blocks and writes in parallel threads.
+    Bulk version of write_df_to_sheet for large DataFrames (xlwings only).
+    Writes rows in range assignments of up to _WRITE_CHUNK_ROWS rows. Excel
+    serializes COM calls, so worker threads only added contention;
+    max_workers is kept for compatibility and ignored, as is clear_by_label
+    (the target range is cleared in one call).
     """
     logger.info(
-        f"[ASYNC] Writing to {path} in sheet '{sheet_name}' from cell {start_cell} with {max_workers} workers"
+        f"[ASYNC] Writing to {path} in sheet '{sheet_name}' from cell {start_cell}"
     )
+    if max_workers != 4:
+        logger.warning(
+            "write_df_to_sheet_async: max_workers is deprecated and ignored; rows are written in one bulk assignment."
+        )
+    if len(df) == 0 and not header:
+        # Nothing to write; don't start Excel for it
+        logger.info("[ASYNC] DataFrame is empty; skipping write.")
+        return
     wb, app, use_com = open_workbook(path, visible)
     if use_com:
         # COM automation is not thread-safe; fallback to sync
@@ -209,54 +417,73 @@ def write_df_to_sheet_async(
     # Optionally clear before writing
     target = ws.range((start_row, start_col), (end_row, end_col))
     if clear:
-        if clear_by_label:
-            for idx, col in enumerate(df.columns, start_col):
-                col_range = ws.range((start_row, idx), (end_row, idx))
-                col_range.clear_contents()
-        else:
-            target.clear_contents()
+        target.clear_contents()
 
     # Write header if needed
     if header:
-        for j, h in enumerate(df.columns, start_col):
-            ws.Cells(start_row, j).Value = h
+        ws.range((start_row, start_col), (start_row, end_col)).value = list(df.columns)
         data_start = start_row + 1
     else:
         data_start = start_row
 
-    # Split DataFrame into blocks for parallel writing
-    block_size = max(100, n_rows // max_workers)
-    blocks = [(i, min(i + block_size, n_rows)) for i in range(0, n_rows, block_size)]
-
-    def write_block(start, stop):
-        for i, row in enumerate(df.values[start:stop], data_start + start):
-            for j, val in enumerate(row, start_col):
-                ws.Cells(i, j).Value = val
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(write_block, start, stop) for start, stop in blocks]
-        for f in as_completed(futures):
-            f.result()
+    # One range assignment per chunk of rows instead of one COM call per
+    # cell; chunking bounds the size of each marshalled array
+    try:
+        values = _bulk_values(df)
+        for chunk_start in range(0, n_rows, _WRITE_CHUNK_ROWS):
+            block = values[chunk_start : chunk_start + _WRITE_CHUNK_ROWS]
+            ws.range(
+                (data_start + chunk_start, start_col),
+                (data_start + chunk_start + len(block) - 1, end_col),
+            ).options(ndim=2).value = block
+    except Exception:
+        close_workbook(wb, app, save=False, use_com=use_com)
+        raise
 
     close_workbook(wb, app, save=True, use_com=use_com)
 
 
 def close_workbook(
-    wb: Any, app_obj: Any, save: bool = True, use_com: bool = False
+    wb: Any,
+    app_obj: Any,
+    save: bool = True,
+    use_com: bool = False,
+    owns_app: bool = False,
 ) -> None:
     """
-    Close the workbook and quit the application.
+    Close the workbook. The cached Excel application is left running for the
+    next open_workbook call unless owns_app is True.
+    Application settings are restored before saving; a workbook saved while
+    calculation is manual would reopen in manual mode.
     """
+    global _XW_APP, _COM_APP
+    _restore_app_state(app_obj, use_com)
     if not use_com:
         if save:
             wb.save()
         wb.close()
-        app_obj.quit()
+        if owns_app:
+            app_obj.quit()
+            if app_obj is _XW_APP:
+                _XW_APP = None
     else:
         if save:
             wb.Save()
         wb.Close(SaveChanges=save)
-        app_obj.Quit()
+        if owns_app:
+            app_obj.Quit()
+            if app_obj is _COM_APP:
+                _COM_APP = None
+
+
+def _downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """Return a copy of df with float64 as float32 and int64 shrunk to fit."""
+    df = df.copy(deep=False)
+    for col in df.select_dtypes("float64").columns:
+        df[col] = df[col].astype("float32")
+    for col in df.select_dtypes("int64").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
 
 
 def write_df_to_sheet(
@@ -269,12 +496,25 @@ def write_df_to_sheet(
     clear: bool = True,
     visible: bool = False,
     clear_by_label: bool = False,
+    downcast: bool = False,
 ) -> None:
     """
     Write DataFrame to an Excel sheet without removing any formatting.
-    Only clears the cells where values will be written.
+    Only clears the cells where values will be written, in one call;
+    clear_by_label is kept for compatibility, since the per-column ranges
+    it used to clear one by one make up that same target range.
+    downcast=True sends float64/int64 columns as float32/smallest int to
+    halve the marshalled payload; float32 keeps ~7 significant digits, so
+    only opt in when that precision is enough.
     """
     logger.info(f"Writing to {path} in sheet '{sheet_name}' from cell {start_cell}")
+    if len(df) == 0 and not header:
+        # Nothing to write; don't start Excel for it
+        logger.info("write_df_to_sheet: DataFrame is empty; skipping write.")
+        return
+
+    if downcast:
+        df = _downcast_numeric(df)
 
     wb, app, use_com = open_workbook(path, visible)
 
@@ -285,11 +525,14 @@ def write_df_to_sheet(
             logger.info(f"write_df_to_sheet: DataFrame head: {df.head().to_dict()}")
 
             if not use_com:
-                sheet_names = [s.name for s in wb.sheets]
-                if sheet_name not in sheet_names:
+                # Direct lookup; the sheet name list is only built on failure
+                # (KeyError on some platforms, a COM error on Windows)
+                try:
+                    ws = wb.sheets[sheet_name]
+                except Exception as lookup_error:
+                    sheet_names = [s.name for s in wb.sheets]
                     logger.error(f"DEBUG: Available sheets in '{path}': {sheet_names}")
-                    raise ValueError(f"Sheet '{sheet_name}' not found in workbook. Available sheets: {sheet_names}")
-                ws = wb.sheets[sheet_name]
+                    raise ValueError(f"Sheet '{sheet_name}' not found in workbook. Available sheets: {sheet_names}") from lookup_error
                 cell = ws.range(start_cell)
 
                 def clear_func(rng):
@@ -320,43 +563,128 @@ def write_df_to_sheet(
         if not use_com:
             target = ws.range((start_row, start_col), (end_row, end_col))
             if clear:
-                if clear_by_label:
-                    # Clear by column label (header row)
-                    for idx, col in enumerate(df.columns, start_col):
-                        col_range = ws.range((start_row, idx), (end_row, idx))
-                        col_range.clear_contents()
-                else:
-                    clear_func(target)
+                clear_func(target)
             logger.info("write_df_to_sheet: Writing DataFrame to Excel via xlwings...")
             target.options(index=index, header=header).value = df
             logger.info(f"write_df_to_sheet: Write complete. First cell value: {ws.range((start_row, start_col)).value}")
         else:
             target = ws.Range(ws.Cells(start_row, start_col), ws.Cells(end_row, end_col))
             if clear:
-                if clear_by_label:
-                    # Clear by column label (header row)
-                    for idx, col in enumerate(df.columns, start_col):
-                        col_rng = ws.Range(ws.Cells(start_row, idx), ws.Cells(end_row, idx))
-                        col_rng.ClearContents()
-                else:
-                    clear_func(target)
+                clear_func(target)
             logger.info("write_df_to_sheet: Writing DataFrame to Excel via COM...")
-            data_start = start_row
-            if header:
-                for j, h in enumerate(df.columns, start_col):
-                    ws.Cells(start_row, j).Value = h
-                data_start += 1
-            for i, row in enumerate(df.values.tolist(), data_start):
-                for j, val in enumerate(row, start_col):
-                    ws.Cells(i, j).Value = val
+            # Header and data go out as one 2-D SAFEARRAY in a single COM
+            # call, instead of one Cells().Value round trip per cell
+            rows = [tuple(df.columns)] if header else []
+            rows.extend(map(tuple, df.to_numpy().tolist()))
+            if rows:
+                import pythoncom
+                from win32com.client import VARIANT
+
+                target.Value = VARIANT(
+                    pythoncom.VT_ARRAY | pythoncom.VT_VARIANT, tuple(rows)
+                )
             logger.info(f"write_df_to_sheet: Write complete. First cell value: {ws.Cells(start_row, start_col).Value}")
     except Exception as e:
         logger.error(f"write_df_to_sheet: Exception during write: {e}")
+        close_workbook(wb, app, save=False, use_com=use_com)
         raise
 
     close_workbook(wb, app, save=True, use_com=use_com)
 
 
+def _fast_copy(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """
+    Copy src to dst like shutil.copy, letting the kernel clone the data where
+    it can. On Linux, os.copy_file_range shares extents on reflink-capable
+    filesystems (btrfs, XFS), so no bytes are moved. Anything else, including
+    Windows and filesystems that reject the call, uses shutil.copy.
+    """
+    if os.name != "nt" and hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(
+                        fsrc.fileno(), fdst.fileno(), remaining
+                    )
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copymode(str(src), str(dst))
+                return
+        except OSError:
+            pass
+    shutil.copy(str(src), str(dst))
+
+
+def _write_df_openpyxl(
+    path: Union[str, Path],
+    sheet_name: str,
+    df: pd.DataFrame,
+    start_cell: str = "A2",
+    header: bool = False,
+    index: bool = False,
+) -> None:
+    """
+    Write df into an existing workbook with openpyxl, without starting Excel.
+    Cell formatting is kept, but openpyxl drops charts, images, and pivot
+    caches it cannot round-trip, so only use it for plain templates.
+    """
+    if len(df) == 0 and not header:
+        return
+    try:
+        wb = load_workbook(path)
+        ws = wb[sheet_name]
+    except KeyError as e:
+        raise ValueError(f"Sheet '{sheet_name}' not found in workbook.") from e
+
+    col_letter, start_row = coordinate_from_string(start_cell)
+    start_col = column_index_from_string(col_letter)
+    if index:
+        df = df.reset_index()
+    # One columnar pass turns NaN/NaT into None (an empty cell) instead of
+    # checking every value while writing
+    df = df.astype(object).where(df.notna(), None)
+
+    rows = df.itertuples(index=False, name=None)
+    if header:
+        rows = itertools.chain([tuple(df.columns)], rows)
+    for row_num, row in enumerate(rows, start_row):
+        for col_num, value in enumerate(row, start_col):
+            ws.cell(row=row_num, column=col_num, value=value)
+    wb.save(path)
+    wb.close()
+
+
+def _write_df_xlsxwriter(
+    path: Union[str, Path],
+    sheet_name: str,
+    df: pd.DataFrame,
+    start_cell: str = "A2",
+    header: bool = False,
+    index: bool = False,
+) -> None:
+    """
+    Write df to a new workbook at path with xlsxwriter. Nothing from an
+    existing file at path is kept. constant_memory mode is not used: it
+    drops cells written out of row order, and to_excel writes by column.
+    """
+    if not XLSXWRITER_AVAILABLE:
+        raise ImportError("engine='xlsxwriter' requires the xlsxwriter package.")
+    col_letter, start_row = coordinate_from_string(start_cell)
+    start_col = column_index_from_string(col_letter)
+    with pd.ExcelWriter(path, engine="xlsxwriter") as writer:
+        df.to_excel(
+            writer,
+            sheet_name=sheet_name,
+            startrow=start_row - 1,
+            startcol=start_col - 1,
+            header=header,
+            index=index,
+        )
+
+
 def write_df_to_template(
     template_path: Union[str, Path],
     output_path: Union[str, Path],
@@ -367,13 +695,24 @@ def write_df_to_template(
     index: bool = False,
     visible: bool = False,
     open_file: bool = False,
+    engine: str = "excel",
 ) -> None:
     """
     Copy an Excel template and write a DataFrame into it without altering
     any existing formatting, charts, tables, or objects.
 
+    engine="openpyxl" writes the copy with openpyxl instead of driving
+    Excel, skipping the Excel launch and COM marshalling. It keeps cell
+    formatting but not charts or images, so it suits plain templates only.
+    engine="xlsxwriter" writes the data into a new workbook with the same
+    sheet name and layout; it is the fastest, but the template's
+    formatting and other sheets are not carried over.
     If open_file is True, launch the filled workbook in Excel after writing.
     """
+    if engine not in ("excel", "openpyxl", "xlsxwriter"):
+        raise ValueError(
+            f"Unknown engine '{engine}'; use 'excel', 'openpyxl' or 'xlsxwriter'."
+        )
     template_path = Path(template_path)
     output_path = Path(output_path)  # Use the provided output_path
     os.makedirs(output_path.parent, exist_ok=True)
@@ -414,17 +753,30 @@ def write_df_to_template(
         )
     # If output_path is '_Rx Repricing_wf.xlsx' in working dir, allow overwrite; else, create new copy as above
     # (No extra logic needed, as above already handles protected/template cases)
-    shutil.copy(str(template_path), str(output_path))
-    write_df_to_sheet(
-        path=output_path,
-        sheet_name=sheet_name,
-        df=df,
-        start_cell=start_cell,
-        header=header,
-        index=index,
-        clear=True,
-        visible=visible,
-    )
+    if engine == "xlsxwriter":
+        # Builds the file from scratch, so the template is not copied
+        _write_df_xlsxwriter(
+            output_path, sheet_name, df, start_cell=start_cell, header=header, index=index
+        )
+    elif engine == "openpyxl":
+        _fast_copy(template_path, output_path)
+        _write_df_openpyxl(
+            output_path, sheet_name, df, start_cell=start_cell, header=header, index=index
+        )
+    else:
+        _fast_copy(template_path, output_path)
+        write_df_to_sheet(
+            path=output_path,
+            sheet_name=sheet_name,
+            df=df,
+            start_cell=start_cell,
+            header=header,
+            index=index,
+            # The write assigns every cell of the target range, so clearing
+            # it first is an extra COM call that changes nothing
+            clear=False,
+            visible=visible,
+        )
     if open_file:
         try:
             output_path_str = str(output_path)
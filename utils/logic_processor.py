@@ -6,16 +6,51 @@ Following CodeScene ACE principles for better code organization
 import logging
 import warnings
 from dataclasses import dataclass
-from typing import Dict
-
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; reversal matching falls back to pd.merge_asof
+    njit = None
+
 logger = logging.getLogger(__name__)
 
 # Filter out specific warnings
 warnings.filterwarnings("ignore", category=FutureWarning, message=".*swapaxes.*")
 
+# Largest fill-date gap between a reversal and the claim it reverses
+MATCH_WINDOW = pd.Timedelta(days=30)
+
+
+def _nearest_claim_kernel(
+    rev_keys, rev_dates, claim_keys, claim_dates, claim_rows, window
+):
+    """Return the nearest claim row for each reversal, or -1 if none matches.
+
+    claim_keys must be sorted; dates and window are int64 nanoseconds. Among
+    claims equally far from the reversal, the lowest row wins.
+    """
+    best = np.full(rev_keys.shape[0], -1, dtype=np.int64)
+    for i in range(rev_keys.shape[0]):
+        lo = np.searchsorted(claim_keys, rev_keys[i], side="left")
+        hi = np.searchsorted(claim_keys, rev_keys[i], side="right")
+        best_gap = window + 1
+        for j in range(lo, hi):
+            gap = abs(claim_dates[j] - rev_dates[i])
+            if gap < best_gap or (gap == best_gap and claim_rows[j] < best[i]):
+                best_gap = gap
+                best[i] = claim_rows[j]
+    return best
+
+
+if njit is not None:
+    # Serial on purpose: process_logic_block already runs in one
+    # multiprocessing worker per core, and a numba thread pool in each
+    # worker would oversubscribe the machine
+    _nearest_claim_kernel = njit(cache=True)(_nearest_claim_kernel)
+
 
 @dataclass
 class LogicData:
@@ -30,16 +65,6 @@ class LogicData:
     abs_qty: np.ndarray
 
 
-@dataclass
-class MatchContext:
-    """Context object to encapsulate matching parameters."""
-
-    arr: np.ndarray
-    col_idx: Dict[str, int]
-    logic_data: LogicData
-    claim_idx: np.ndarray
-
-
 class LogicProcessor:
     """Handles logic processing for reversal matching."""
 
@@ -49,119 +74,166 @@ class LogicProcessor:
         Vectorized numpy logic to mark 'OR' in 'Logic' for reversals with matching claims.
         Refactored to reduce nesting complexity and improve readability.
         """
-        arr = df_block.to_numpy()
-        col_idx = {col: i for i, col in enumerate(df_block.columns)}
-
-        # Extract and prepare data
-        logic_data = LogicProcessor._extract_logic_data(arr, col_idx)
+        # Columns are read straight from the frame rather than through
+        # to_numpy(), which would copy every column into one object array
+        logic_data = LogicProcessor._extract_logic_data(df_block)
+        result = df_block.reset_index(drop=True)
 
         # Early return if no reversals to process
         if not np.any(logic_data.is_reversal):
-            return pd.DataFrame(arr, columns=df_block.columns)
-
-        # Process reversals with reduced nesting
-        LogicProcessor._process_reversals(arr, col_idx, logic_data)
+            return result
 
-        return pd.DataFrame(arr, columns=df_block.columns)
+        logic = result["Logic"].to_numpy(dtype=object, copy=True)
+        LogicProcessor._process_reversals(logic, logic_data)
+        result["Logic"] = logic
+        return result
 
     @staticmethod
-    def _extract_logic_data(arr: np.ndarray, col_idx: Dict[str, int]) -> LogicData:
+    def _extract_logic_data(df_block: pd.DataFrame) -> LogicData:
         """Extract and prepare data for logic processing."""
-        qty = arr[:, col_idx["QUANTITY"]].astype(float)
+        qty = df_block["QUANTITY"].to_numpy(dtype=float)
+        dates = df_block["DATEFILLED"]
+        if dates.dtype.kind == "M":
+            # Already datetime64; no parsing needed
+            datefilled = pd.DatetimeIndex(dates)
+        else:
+            datefilled = pd.to_datetime(dates.to_numpy(), errors="coerce")
 
         return LogicData(
             qty=qty,
             is_reversal=qty < 0,
             is_claim=qty > 0,
-            ndc=arr[:, col_idx["NDC"]].astype(str),
-            member=arr[:, col_idx["MemberID"]].astype(str),
-            datefilled=pd.to_datetime(arr[:, col_idx["DATEFILLED"]], errors="coerce"),
+            ndc=LogicProcessor._as_str(df_block["NDC"]),
+            member=LogicProcessor._as_str(df_block["MemberID"]),
+            datefilled=datefilled,
             abs_qty=np.abs(qty),
         )
 
     @staticmethod
-    def _process_reversals(
-        arr: np.ndarray, col_idx: Dict[str, int], logic_data: LogicData
-    ):
-        """Process reversals with matching logic, using guard clauses to reduce nesting."""
-        rev_idx = np.where(logic_data.is_reversal)[0]
-        claim_idx = (
-            np.where(logic_data.is_claim)[0]
-            if np.any(logic_data.is_claim)
-            else np.array([], dtype=int)
-        )
-
-        # Create context object to reduce function argument count
-        match_context = MatchContext(arr, col_idx, logic_data, claim_idx)
+    def _as_str(column: pd.Series) -> np.ndarray:
+        """
+        Return column as an array of str, casting only when it holds anything
+        else. Keys must compare as text, so 123 and "123" are the same NDC.
+        Missing values are cast too ("<NA>", "nan", "None"), so they stay
+        ordinary keys instead of NA, which grouping would drop.
+        """
+        if not column.hasnans and pd.api.types.infer_dtype(column) == "string":
+            return column.to_numpy(dtype=object)
+        return column.to_numpy().astype(str)
 
-        for i in rev_idx:
-            found_match = LogicProcessor._try_find_match(match_context, i)
+    @staticmethod
+    def _process_reversals(logic: np.ndarray, logic_data: LogicData):
+        """Mark every reversal and the closest matching claim of each as 'OR'."""
+        rev_idx = np.flatnonzero(logic_data.is_reversal)
+        claim_rows = LogicProcessor._match_reversals(logic_data, rev_idx)
 
-            # Mark unmatched reversals as 'OR'
-            if not found_match:
-                arr[i, col_idx["Logic"]] = "OR"
+        # Unmatched reversals are marked 'OR' too, so every reversal is marked
+        logic[rev_idx] = "OR"
+        logic[claim_rows] = "OR"
 
     @staticmethod
-    def _try_find_match(context: MatchContext, reversal_idx: int) -> bool:
-        """Attempt to find a matching claim for a reversal. Returns True if match found."""
-        # Guard clause: no claims to match against
-        if context.claim_idx.size == 0:
-            return False
-
-        # Find potential matches
-        matches = LogicProcessor._find_matching_claims(
-            context.logic_data, context.claim_idx, reversal_idx
+    def _match_keys(logic_data: LogicData) -> np.ndarray:
+        """
+        Number each distinct (NDC, member, absolute quantity) triple, so rows
+        that could match share one int64 key. Grouping hashes the three
+        columns once; joining on the key avoids per-row tuples of objects.
+        """
+        triples = pd.DataFrame(
+            {
+                "ndc": logic_data.ndc,
+                "member": logic_data.member,
+                "qty": logic_data.abs_qty,
+            }
         )
+        groups = triples.groupby(list(triples.columns), sort=False, dropna=False)
+        return groups.ngroup().to_numpy()
 
-        # Guard clause: no matches found
-        if not np.any(matches):
-            return False
-
-        # Select the best match (closest date)
-        matching_claim_indices = context.claim_idx[matches]
-        if len(matching_claim_indices) > 1:
-            # Calculate date differences for all matches
-            date_diffs = np.abs(
-                (
-                    context.logic_data.datefilled[matching_claim_indices]
-                    - context.logic_data.datefilled[reversal_idx]
-                ).days
+    @staticmethod
+    def _match_reversals(logic_data: LogicData, rev_idx: np.ndarray) -> np.ndarray:
+        """
+        Return the row of the closest matching claim for each reversal that has one.
+        A claim matches when NDC, member and absolute quantity are equal and it
+        was filled within 30 days of the reversal; ties go to the lowest row.
+        """
+        claim_idx = np.flatnonzero(logic_data.is_claim)
+        has_date = ~logic_data.datefilled.isna()
+        rev_idx = rev_idx[has_date[rev_idx]]
+        claim_idx = claim_idx[has_date[claim_idx]]
+        if rev_idx.size == 0 or claim_idx.size == 0:
+            return np.array([], dtype=np.intp)
+
+        keys = LogicProcessor._match_keys(logic_data)
+        if njit is not None:
+            return LogicProcessor._nearest_claims_jit(
+                keys, logic_data.datefilled, rev_idx, claim_idx
             )
-            # Select the match with the smallest date difference
-            best_match_idx = matching_claim_indices[np.argmin(date_diffs)]
-        else:
-            best_match_idx = matching_claim_indices[0]
-
-        # Mark both reversal and matching claim as 'OR'
-        context.arr[reversal_idx, context.col_idx["Logic"]] = "OR"
-        context.arr[best_match_idx, context.col_idx["Logic"]] = "OR"
-        return True
+        return LogicProcessor._nearest_claims_asof(
+            keys, logic_data.datefilled, rev_idx, claim_idx
+        )
 
     @staticmethod
-    def _find_matching_claims(
-        logic_data: LogicData, claim_idx: np.ndarray, reversal_idx: int
+    def _nearest_claims_jit(
+        keys: np.ndarray,
+        datefilled: pd.DatetimeIndex,
+        rev_idx: np.ndarray,
+        claim_idx: np.ndarray,
     ) -> np.ndarray:
-        """Find claims that match the reversal based on NDC, member, quantity, and date."""
-        matches = (
-            (logic_data.ndc[claim_idx] == logic_data.ndc[reversal_idx])
-            & (logic_data.member[claim_idx] == logic_data.member[reversal_idx])
-            & (logic_data.abs_qty[claim_idx] == logic_data.abs_qty[reversal_idx])
+        """Run _nearest_claim_kernel over claims sorted by key."""
+        dates = datefilled.as_unit("ns").asi8
+        claim_order = claim_idx[np.argsort(keys[claim_idx], kind="stable")]
+        best = _nearest_claim_kernel(
+            keys[rev_idx],
+            dates[rev_idx],
+            keys[claim_order],
+            dates[claim_order],
+            claim_order,
+            MATCH_WINDOW.value,
         )
+        return best[best >= 0]
 
-        # Add date constraint (within 30 days)
-        try:
-            date_diffs = np.abs(
-                (
-                    logic_data.datefilled[claim_idx]
-                    - logic_data.datefilled[reversal_idx]
-                ).days
+    @staticmethod
+    def _nearest_claims_asof(
+        keys: np.ndarray,
+        datefilled: pd.DatetimeIndex,
+        rev_idx: np.ndarray,
+        claim_idx: np.ndarray,
+    ) -> np.ndarray:
+        """Find each reversal's nearest claim with pd.merge_asof (no numba)."""
+
+        def frame(idx: np.ndarray) -> pd.DataFrame:
+            return pd.DataFrame(
+                {
+                    "key": keys[idx],
+                    "date": datefilled[idx],
+                    "row": idx,
+                }
             )
-            matches &= date_diffs <= 30
-        except Exception as e:
-            logger.warning(f"Date filtering failed: {e}")
-            # Continue without date constraint
 
-        return matches
+        reversals = frame(rev_idx).sort_values("date", kind="stable")
+        claims = frame(claim_idx).rename(columns={"row": "claim_row"})
+        claims["claim_date"] = claims["date"]
+
+        # merge_asof hash-joins on the key and binary-searches the dates,
+        # replacing the old full claim scan per reversal. It is run
+        # once per direction, with claims ordered so that each side picks the
+        # lowest row among same-day claims, instead of direction="nearest"
+        candidates = [
+            pd.merge_asof(
+                reversals,
+                claims.sort_values(["date", "claim_row"], ascending=[True, asc]),
+                on="date",
+                by="key",
+                direction=direction,
+                tolerance=MATCH_WINDOW,
+            )
+            for direction, asc in (("backward", False), ("forward", True))
+        ]
+        matches = pd.concat(candidates).dropna(subset=["claim_row"])
+        if matches.empty:
+            return np.array([], dtype=np.intp)
+        matches["gap"] = (matches["date"] - matches["claim_date"]).abs()
+        best = matches.sort_values(["gap", "claim_row"]).drop_duplicates("row")
+        return best["claim_row"].to_numpy(dtype=np.intp)
 
 
 # Backwards compatibility functions
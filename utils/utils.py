@@ -1,26 +1,60 @@
+from __future__ import annotations
+
+import atexit
 import csv
+import functools
 import json
 import logging
+import logging.handlers
 import os
 import sys
+import threading
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import pandas as pd
 import hashlib
-import pickle
+import importlib.util
+
+# numpy, pandas and pyarrow are imported inside the functions that use them,
+# so scripts that only write the audit log do not pay ~300 ms to load them
+if TYPE_CHECKING:
+    import pandas as pd
 
 project_root = Path(__file__).resolve().parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
-import getpass  # noqa: E402
 from dataclasses import dataclass  # noqa: E402
-from datetime import datetime  # noqa: E402
 
-# Load the audit log path from config using pathlib
+# The audit log path comes from this config file. It is read on first use, so
+# importing this module (e.g. in a worker process) does not require the file
 config_path = Path(__file__).parent.parent / "config" / "file_paths.json"
-with config_path.open("r") as f:
-    file_paths = json.load(f)
-audit_log_path = Path(os.path.expandvars(file_paths["audit_log"]))
+
+
+@functools.lru_cache(maxsize=1)
+def _config_file_paths():
+    with config_path.open("r") as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=1)
+def _configured_audit_log_path():
+    return Path(os.path.expandvars(_config_file_paths()["audit_log"]))
+
+
+def _audit_log_path():
+    """Return the audit log path; a module-level audit_log_path assignment wins."""
+    path = globals().get("audit_log_path")
+    return path if path is not None else _configured_audit_log_path()
+
+
+def __getattr__(name):
+    # file_paths and audit_log_path used to be loaded at import time
+    if name == "file_paths":
+        return _config_file_paths()
+    if name == "audit_log_path":
+        return _audit_log_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass
@@ -44,40 +78,193 @@ def ensure_directory_exists(path):
         print(f"[ensure_directory_exists] Error: {e}")
 
 
-def write_audit_log(script_name, message, status="INFO"):
+# Buffered audit rows reach the CSV at most this many seconds after logging
+AUDIT_FLUSH_INTERVAL = 1.0
+# A logging call flushes the buffer itself once this many rows are waiting,
+# which bounds memory if entries arrive faster than the interval drains them
+AUDIT_MAX_PENDING = 4096
+# The log is rotated once it grows past this size, keeping this many backups.
+# Rotation assumes a single writer at a time: the size is checked when a batch
+# opens the file, and other processes only hold it while writing a batch
+AUDIT_MAX_BYTES = 5 * 1024 * 1024
+AUDIT_BACKUP_COUNT = 3
+AUDIT_HEADER = ["Timestamp", "User", "Script", "Message", "Status"]
+
+
+class _AuditLogger:
     """
-    Appends a log entry to the shared audit log in OneDrive. Rotates log if too large.
+    Buffers audit rows in memory and appends them to the per-user CSV in
+    batches. The file is opened for each batch and closed straight after,
+    so other processes writing the same log (the GUI and the disruption
+    scripts it launches) are never blocked by a handle this one keeps open.
+    Rotation is delegated to a RotatingFileHandler that owns the stream; no
+    records are emitted through it.
+
+    A daemon thread flushes the buffer every AUDIT_FLUSH_INTERVAL seconds and
+    flush_and_close() runs at interpreter exit, so no entries are lost on a
+    normal shutdown. Rows that fail to write stay buffered for the next flush;
+    rows logged after flush_and_close() are written straight away.
     """
-    try:
-        username = getpass.getuser()
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = [timestamp, username, script_name, message, status]
 
-        base_log_dir = audit_log_path.parent
-        user_log_dir = base_log_dir / username
-        user_log_path = user_log_dir / "Audit_Log.csv"
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._pending = {}
+        self._pending_rows = 0
+        self._thread = None
+        self._closed = False
+        self._handler = None
+
+    def log(self, path, entry, sync=False):
+        with self._lock:
+            self._pending.setdefault(path, []).append(entry)
+            self._pending_rows += 1
+            # Once closed no writer thread runs, so nothing would drain the
+            # buffer; write each entry as it comes instead
+            flush_now = (
+                sync or self._closed or self._pending_rows >= AUDIT_MAX_PENDING
+            )
+            # Checked and started under the lock so only one writer exists
+            if not flush_now and (
+                self._thread is None or not self._thread.is_alive()
+            ):
+                self._thread = threading.Thread(
+                    target=self._run, name="audit-log-writer", daemon=True
+                )
+                self._thread.start()
+        if flush_now:
+            self.flush()
+
+    def _run(self):
+        while not self._stop.wait(AUDIT_FLUSH_INTERVAL):
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._pending_rows = 0
+            for path, rows in pending.items():
+                try:
+                    self._write(path, rows)
+                except Exception as e:
+                    print(f"[Audit Log] Error: {e}")
+                    # Keep the rows for the next flush instead of losing them
+                    self._pending[path] = rows
+                    self._pending_rows += len(rows)
+
+    def flush_and_close(self):
+        with self._lock:
+            self._closed = True
+            self._stop.set()
+        self.flush()
+
+    def _write(self, path, rows):
+        try:
+            self._open_file(path)
+            # Checked on every batch, on a handle opened just now, so the size
+            # includes rows other processes appended since the last one
+            stream = self._handler.stream
+            stream.seek(0, os.SEEK_END)
+            if stream.tell() > AUDIT_MAX_BYTES:
+                stream = self._rotate(path)
+            # The handler's text-mode stream turns "\n" into the platform line ending
+            writer = csv.writer(stream, lineterminator="\n")
+            if stream.tell() == 0:
+                writer.writerow(AUDIT_HEADER)
+            writer.writerows(rows)
+        finally:
+            self._close_file()
+
+    def _open_file(self, path):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            print(f"[Audit Log] Could not create user log folder: {e}")
+        self._handler = logging.handlers.RotatingFileHandler(
+            path,
+            maxBytes=AUDIT_MAX_BYTES,
+            backupCount=AUDIT_BACKUP_COUNT,
+            encoding="utf-8",
+        )
 
-        write_header = not user_log_path.exists()
-        if not user_log_dir.exists():
+    def _rotate(self, path):
+        """Roll the log over and return the stream to append to."""
+        try:
+            self._handler.doRollover()
+        except OSError as e:
+            # On Windows the rename fails while another process is writing
+            # the file; append to it as is and retry on a later flush
+            print(f"[Audit Log] Could not rotate log: {e}")
+            self._close_file()
+            self._open_file(path)
+            self._handler.stream.seek(0, os.SEEK_END)
+        return self._handler.stream
+
+    def _close_file(self):
+        if self._handler is not None:
             try:
-                user_log_dir.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                print(f"[Audit Log] Could not create user log folder: {e}")
-
-        max_size = 5 * 1024 * 1024
-        if user_log_path.exists() and user_log_path.stat().st_size > max_size:
-            for i in range(2, 0, -1):
-                prev = user_log_path.with_suffix(f".csv.{i}")
-                prev2 = user_log_path.with_suffix(f".csv.{i + 1}")
-                if prev.exists():
-                    prev.replace(prev2)
-            user_log_path.replace(user_log_path.with_suffix(".csv.1"))
-
-        with user_log_path.open(mode="a", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-            if write_header:
-                writer.writerow(["Timestamp", "User", "Script", "Message", "Status"])
-            writer.writerow(log_entry)
+                self._handler.close()
+            except Exception:
+                pass
+        self._handler = None
+
+
+_audit_logger = _AuditLogger()
+atexit.register(_audit_logger.flush_and_close)
+
+
+def flush_audit_log():
+    """
+    Writes any buffered audit log entries to disk immediately.
+    """
+    _audit_logger.flush()
+
+
+# (epoch minute, "YYYY-mm-dd HH:MM") of the last audit timestamp. Time zone
+# offsets are whole minutes, so the local date/hour/minute only change when
+# the epoch minute does and only the seconds need formatting per entry
+_timestamp_minute = (None, "")
+
+
+def _audit_timestamp():
+    """Return the local time as "YYYY-mm-dd HH:MM:SS" for an audit entry."""
+    global _timestamp_minute
+    now = int(time.time())
+    minute, prefix = _timestamp_minute
+    if now // 60 != minute:
+        prefix = time.strftime("%Y-%m-%d %H:%M", time.localtime(now))
+        # One tuple assignment, so concurrent callers never see a torn pair
+        _timestamp_minute = (now // 60, prefix)
+    return f"{prefix}:{now % 60:02d}"
+
+
+@functools.lru_cache(maxsize=1)
+def _audit_user():
+    """Return the current user name; it cannot change within a process."""
+    import getpass
+
+    return getpass.getuser()
+
+
+@functools.lru_cache(maxsize=8)
+def _user_log_path(audit_log, username):
+    """Return the per-user Audit_Log.csv next to the shared audit log."""
+    return audit_log.parent / username / "Audit_Log.csv"
+
+
+def write_audit_log(script_name, message, status="INFO", sync=False):
+    """
+    Appends a log entry to the shared audit log in OneDrive. Rotates log if too large.
+
+    Entries are buffered and written in batches about once a second; pass
+    sync=True to write the entry (and anything buffered before it) immediately.
+    """
+    try:
+        username = _audit_user()
+        timestamp = _audit_timestamp()
+        log_entry = [timestamp, username, script_name, message, status]
+        user_log_path = _user_log_path(_audit_log_path(), username)
+        _audit_logger.log(user_log_path, log_entry, sync=sync)
     except Exception as e:
         print(f"[Audit Log] Error: {e}")
 
@@ -91,21 +278,49 @@ def log_exception(script_name, exc, status="ERROR"):
     tb = traceback.format_exc()
     msg = f"{exc}: {tb}"
     print(f"[Exception] {msg}")
-    write_audit_log(script_name, msg, status)
+    write_audit_log(script_name, msg, status, sync=True)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_paths_cached(json_path, onedrive_path):
+    """
+    Parses and resolves file_paths.json once per (path, OneDrive folder).
+    Returns (key, path) pairs so the cached value cannot be mutated.
+    """
+    with Path(json_path).open("r") as f:
+        paths = json.load(f)
+
+    resolved_paths = []
+    for key, path in paths.items():
+        if path.startswith("%OneDrive%"):
+            path = path.replace("%OneDrive%", onedrive_path)
+        # abspath only normalizes the string; Path.resolve() would stat every
+        # component on the OneDrive share to follow symlinks
+        resolved_paths.append((key, os.path.abspath(path)))
+    return tuple(resolved_paths)
+
+
+def reload_file_paths():
+    """
+    Drops the parsed file_paths.json so the next load_file_paths call rereads it.
+    """
+    _load_paths_cached.cache_clear()
+    _config_file_paths.cache_clear()
+    _configured_audit_log_path.cache_clear()
 
 
 def load_file_paths(json_file="file_paths.json"):
     """
     Loads a JSON config file, replacing %OneDrive% with the user's OneDrive path.
     Returns a dictionary mapping keys to resolved absolute file paths.
+
+    The file is parsed once per process; call reload_file_paths() after
+    editing it.
     """
     # Always use the config directory for file_paths.json
     config_dir = Path(__file__).parent.parent / "config"
     json_path = config_dir / "file_paths.json"
     try:
-        with json_path.open("r") as f:
-            paths = json.load(f)
-
         # Resolve the user's OneDrive path
         onedrive_path = os.environ.get("OneDrive")
         if not onedrive_path:
@@ -113,13 +328,7 @@ def load_file_paths(json_file="file_paths.json"):
                 "OneDrive environment variable not found. Please ensure OneDrive is set up."
             )
 
-        resolved_paths = {}
-        for key, path in paths.items():
-            if path.startswith("%OneDrive%"):
-                path = path.replace("%OneDrive%", onedrive_path)
-            resolved_paths[key] = str(Path(path).resolve())
-
-        return resolved_paths
+        return dict(_load_paths_cached(str(json_path), onedrive_path))
 
     except Exception:
         logging.exception(f"Failed to load or resolve file paths from {json_path}")
@@ -135,15 +344,27 @@ def standardize_pharmacy_ids(df):
         df (pd.DataFrame): Claims DataFrame.
 
     Returns:
-        pd.DataFrame: Updated DataFrame with padded ID columns.
+        pd.DataFrame: Updated DataFrame with padded ID columns, stored as
+        Arrow-backed strings when pyarrow is installed.
     """
-    import numpy as np
-    if "PHARMACYNPI" in df.columns:
-        # Replace NaN values before converting to string to avoid 'nan' strings
-        df["PHARMACYNPI"] = df["PHARMACYNPI"].replace([np.nan, None], '').astype(str).str.replace('nan', '', regex=False).str.zfill(10)
-    if "NABP" in df.columns:
-        # Replace NaN values before converting to string to avoid 'nan' strings
-        df["NABP"] = df["NABP"].replace([np.nan, None], '').astype(str).str.replace('nan', '', regex=False).str.zfill(7)
+    import pandas as pd
+
+    for col, width in (("PHARMACYNPI", 10), ("NABP", 7)):
+        if col not in df.columns:
+            continue
+        if pd.api.types.is_integer_dtype(df[col].dtype) and not df[col].hasnans:
+            # Numeric extracts cast and pad straight from the int64 buffer,
+            # without building a string per ID first
+            ids = df[col].to_numpy(dtype="int64")
+            df[col] = _zero_pad_ints(ids, width, df.index)
+        else:
+            # NaN/None stay missing through the string cast, so they never
+            # become 'nan'; values already stored as the text 'nan' are
+            # blanked along with them
+            ids = _to_arrow_str(df[col])
+            ids = ids.where(ids.notna() & (ids != "nan"), "")
+            # Left padding runs as one Arrow kernel (utf8_lpad) per column
+            df[col] = ids.str.pad(width, side="left", fillchar="0")
     return df
 
 
@@ -157,18 +378,36 @@ def standardize_network_ids(network):
         network (pd.DataFrame): Network DataFrame.
 
     Returns:
-        pd.DataFrame: Updated network DataFrame with padded ID columns.
+        pd.DataFrame: Updated network DataFrame with padded ID columns, stored
+        as Arrow-backed strings when pyarrow is installed.
     """
     import numpy as np
-    if "pharmacy_npi" in network.columns:
-        # Replace NaN values with 0, convert to int (removes .0), then to string, then pad
-        network["pharmacy_npi"] = network["pharmacy_npi"].replace([np.nan, None], 0).astype(int).astype(str).str.zfill(10)
-    if "pharmacy_nabp" in network.columns:
-        # Replace NaN values with 0, convert to int (removes .0), then to string, then pad
-        network["pharmacy_nabp"] = network["pharmacy_nabp"].replace([np.nan, None], 0).astype(int).astype(str).str.zfill(7)
+
+    for col, width in (("pharmacy_npi", 10), ("pharmacy_nabp", 7)):
+        if col in network.columns:
+            # Replace NaN values with 0, convert to int64 (removes .0, and
+            # 10-digit NPIs don't fit int32), then to string, then pad
+            ids = network[col].fillna(0).to_numpy().astype(np.int64)
+            network[col] = _zero_pad_ints(ids, width, network.index)
     return network
 
 
+def _zero_pad_ints(ids, width, index):
+    """Format an int64 array as zero-padded _STRING_DTYPE strings."""
+    import pandas as pd
+
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        padded = pd.Series(ids.astype(str), index=index, dtype=_STRING_DTYPE)
+        return padded.str.pad(width, side="left", fillchar="0")
+    # Arrow casts and pads in C++; going through pandas' astype would build a
+    # Python str per ID first
+    padded = pc.utf8_lpad(pc.cast(pa.array(ids), pa.string()), width=width, padding="0")
+    return pd.Series(pd.arrays.ArrowStringArray(padded), index=index)
+
+
 def merge_with_network(df, network):
     """
     Performs a left join of df with network on ['PHARMACYNPI','NABP'] ⟷ ['pharmacy_npi','pharmacy_nabp'].
@@ -177,14 +416,26 @@ def merge_with_network(df, network):
         df (pd.DataFrame): Claims DataFrame.
         network (pd.DataFrame): Network DataFrame.
 
+    Network rows repeating an NPI/NABP pair are dropped (first one kept),
+    so each claim row appears exactly once in the result.
+
     Returns:
         pd.DataFrame: Merged DataFrame.
     """
+    network_keys = ["pharmacy_npi", "pharmacy_nabp"]
+    duplicate_keys = network.duplicated(subset=network_keys)
+    if duplicate_keys.any():
+        logging.warning(
+            f"merge_with_network: dropping {int(duplicate_keys.sum())} network rows with duplicate NPI/NABP"
+        )
+        network = network[~duplicate_keys]
     merged = df.merge(
         network,
         left_on=["PHARMACYNPI", "NABP"],
-        right_on=["pharmacy_npi", "pharmacy_nabp"],
+        right_on=network_keys,
         how="left",
+        sort=False,
+        validate="m:1",
     )
 
     # If NABP or NPI cannot be matched, set pharmacy_is_excluded to 'N/A'
@@ -195,9 +446,26 @@ def merge_with_network(df, network):
         )
     return merged
 
+# Arrow-backed strings run .str methods in C++ kernels instead of a Python
+# call per element; plain "string" is the fallback without pyarrow
+_STRING_DTYPE = "string[pyarrow]" if importlib.util.find_spec("pyarrow") else "string"
+
+
+def _to_arrow_str(values: pd.Series) -> pd.Series:
+    """Return values as _STRING_DTYPE; missing values stay missing (not 'nan')."""
+    if values.dtype == _STRING_DTYPE:
+        return values
+    return values.astype(_STRING_DTYPE)
+
 # ---------------------------------------------------------------------------
 # Central pharmacy exclusion helpers
 # ---------------------------------------------------------------------------
+# Lowercased exclusion tokens; anything else (blank, unknown) is REVIEW
+_EXCLUSION_TOKENS = {
+    "yes": True, "y": True, "true": True, "1": True,
+    "no": False, "n": False, "false": False, "0": False,
+}
+
 def normalize_pharmacy_is_excluded(val):
     """Normalize raw exclusion indicator to True/False/REVIEW.
 
@@ -205,16 +473,27 @@ def normalize_pharmacy_is_excluded(val):
     """
     if val is None:
         return "REVIEW"
-    v = str(val).strip().lower()
-    if v == "":
-        return "REVIEW"
-    if v in {"yes", "y", "true", "1"}:
-        return True
-    if v in {"no", "n", "false", "0"}:
-        return False
-    return "REVIEW"
+    return _EXCLUSION_TOKENS.get(str(val).strip().lower(), "REVIEW")
+
+def _normalize_pharmacy_is_excluded_series(values: pd.Series) -> pd.Series:
+    """Series form of normalize_pharmacy_is_excluded, without a per-row call."""
+    tokens = values.astype(str).str.strip().str.lower().map(_EXCLUSION_TOKENS)
+    return tokens.where(tokens.notna(), "REVIEW")
 
-_PHARMACY_CACHE_FILE = Path(__file__).resolve().parent.parent / 'build' / 'pharmacy_exclusion_cache.pkl'
+# Normalized exclusion results, indexed by the int8 codes _exclusion_codes yields
+_EXCLUSION_RESULTS = (True, False, "REVIEW")
+_REVIEW_CODE = 2
+_EXCLUSION_CODES = {token: 0 if value else 1 for token, value in _EXCLUSION_TOKENS.items()}
+
+def _exclusion_codes(lookup: pd.Series) -> pd.Series:
+    """Encode a lookup's cleaned exclusion values as _EXCLUSION_RESULTS codes."""
+    import numpy as np
+
+    return lookup.map(_EXCLUSION_CODES).fillna(_REVIEW_CODE).astype(np.int8)
+
+_PHARMACY_CACHE_DIR = Path(__file__).resolve().parent.parent / 'build' / 'pharmacy_exclusion_cache'
+# Pickle cache written by older versions; removed by clear_pharmacy_exclusion_cache
+_LEGACY_PHARMACY_CACHE_FILE = _PHARMACY_CACHE_DIR.with_suffix('.pkl')
 
 # In-memory cache for pharmacy exclusion maps. Declared here to satisfy static
 # type checkers and allow lazy loading/persistence functions to reference it.
@@ -222,51 +501,90 @@ _PHARMACY_EXCLUSION_CACHE: dict = {}
 
 def _compute_network_signature(network: pd.DataFrame) -> str:
     """Compute a robust SHA256 signature for the network content used for exclusion lookups."""
+    import pandas as pd
+
     cols = ["pharmacy_nabp", "pharmacy_npi", "pharmacy_is_excluded"]
-    # Limit size by hashing concatenated first N + last N values for each col
-    parts = []
-    for c in cols:
-        if c in network.columns:
-            series = network[c].astype(str)
-            head = '|'.join(series.head(200).tolist())
-            tail = '|'.join(series.tail(200).tolist())
-            col_blob = f"{c}:{len(series)}:{hashlib.sha256((head+tail).encode('utf-8')).hexdigest()}"
-        else:
-            col_blob = f"{c}:missing"
-        parts.append(col_blob)
-    return '|'.join(parts)
+    present = [c for c in cols if c in network.columns]
+    # Hash every row of the lookup columns so edits anywhere in the network
+    # change the signature, not just edits near the head or tail
+    h = hashlib.sha256()
+    h.update(",".join(present).encode("utf-8"))
+    h.update(str(len(network)).encode("utf-8"))
+    if present:
+        # The IDs are mostly unique, so factorizing first only adds work
+        row_hashes = pd.util.hash_pandas_object(
+            network[present], index=False, categorize=False
+        )
+        h.update(row_hashes.to_numpy().tobytes())
+    return h.hexdigest()
 
-def _load_persistent_cache():
-    global _PHARMACY_EXCLUSION_CACHE
-    if '_PHARMACY_EXCLUSION_CACHE' not in globals():
-        _PHARMACY_EXCLUSION_CACHE = {}
-    if _PHARMACY_CACHE_FILE.exists():
-        try:
-            with _PHARMACY_CACHE_FILE.open('rb') as f:
-                data = pickle.load(f)
-            if isinstance(data, dict):
-                _PHARMACY_EXCLUSION_CACHE.update(data)
-        except Exception:
-            pass
-
-def _save_persistent_cache():
-    global _PHARMACY_EXCLUSION_CACHE
+def _load_persistent_cache(signature: str):
+    """Return the (nabp_map, npi_map) saved for a network signature, or None."""
+    import numpy as np
+    import pandas as pd
+
+    path = _PHARMACY_CACHE_DIR / f"{signature}.parquet"
+    if not path.exists():
+        return None
     try:
-        _PHARMACY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with _PHARMACY_CACHE_FILE.open('wb') as f:
-            pickle.dump(_PHARMACY_EXCLUSION_CACHE, f)
+        # Arrow-backed columns skip building a Python str per key
+        data = pd.read_parquet(path, dtype_backend="pyarrow", columns=["kind", "key", "code"])
+    except Exception:
+        # Unreadable, or written before the maps held codes; rebuilt by the caller
+        return None
+    maps = []
+    for kind in ("nabp", "npi"):
+        rows = data[data["kind"] == kind]
+        codes = rows["code"].to_numpy(dtype=np.int8)
+        maps.append(pd.Series(codes, index=pd.Index(rows["key"].array)))
+    _PHARMACY_EXCLUSION_CACHE[signature] = tuple(maps)
+    return _PHARMACY_EXCLUSION_CACHE[signature]
+
+def _save_persistent_cache(signature: str):
+    """Write the maps cached for a network signature as one Parquet file."""
+    import pandas as pd
+
+    nabp_map, npi_map = _PHARMACY_EXCLUSION_CACHE[signature]
+    data = pd.concat(
+        [
+            pd.DataFrame({"kind": kind, "key": lookup.index, "code": lookup.to_numpy()})
+            for kind, lookup in (("nabp", nabp_map), ("npi", npi_map))
+        ],
+        ignore_index=True,
+    )
+    try:
+        _PHARMACY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        data.to_parquet(_PHARMACY_CACHE_DIR / f"{signature}.parquet", index=False)
     except Exception:
         pass
 
 def clear_pharmacy_exclusion_cache(persistent: bool = True):
-    """Clear in-memory cache and optionally remove persistent cache file."""
+    """Clear in-memory cache and optionally remove persistent cache files."""
     global _PHARMACY_EXCLUSION_CACHE
     _PHARMACY_EXCLUSION_CACHE = {}
-    if persistent and _PHARMACY_CACHE_FILE.exists():
-        try:
-            _PHARMACY_CACHE_FILE.unlink()
-        except Exception:
-            pass
+    if persistent:
+        for path in [_LEGACY_PHARMACY_CACHE_FILE, *_PHARMACY_CACHE_DIR.glob("*.parquet")]:
+            try:
+                path.unlink(missing_ok=True)
+            except Exception:
+                pass
+
+def _exclusion_lookup(network: pd.DataFrame, key_col: str) -> pd.Series:
+    """Map cleaned (stripped, uppercased) network IDs to exclusion result codes.
+
+    The network is cleaned and normalized here, once per cached signature, so
+    resolving claims only has to clean the claim IDs. Repeated IDs resolve as
+    the dict maps this replaced did: the last value per stripped ID, then per
+    uppercased ID the one first seen latest.
+    """
+    import pandas as pd
+
+    keys = network[key_col].astype(str).str.strip()
+    values = network["pharmacy_is_excluded"].astype(str).str.strip().str.lower()
+    lookup = pd.Series(values.to_numpy(), index=keys.to_numpy())
+    lookup = lookup.groupby(level=0, sort=False).last()
+    lookup.index = lookup.index.str.upper()
+    return _exclusion_codes(lookup[~lookup.index.duplicated(keep="last")])
 
 def vectorized_resolve_pharmacy_exclusion(df: pd.DataFrame, network: pd.DataFrame, use_cache: bool = True, persist: bool = True) -> pd.Series:
     """Vectorized resolution of pharmacy exclusion status.
@@ -276,62 +594,58 @@ def vectorized_resolve_pharmacy_exclusion(df: pd.DataFrame, network: pd.DataFram
     pharmacy_nabp, pharmacy_npi, pharmacy_is_excluded.
     Returns a Series aligned to df index with normalized exclusion values.
     """
+    import numpy as np
+    import pandas as pd
+
     # Simple in-process cache keyed by a hash of network identifiers
     global _PHARMACY_EXCLUSION_CACHE
     if '_PHARMACY_EXCLUSION_CACHE' not in globals():
         _PHARMACY_EXCLUSION_CACHE = {}
-    if use_cache:
-        _load_persistent_cache()
     network_signature = _compute_network_signature(network) if use_cache else None
 
     cached_maps = _PHARMACY_EXCLUSION_CACHE.get(network_signature) if use_cache else None
-    # Defensive copies
-    net = network.copy()
-    # Clean identifiers
-    for col in ["pharmacy_nabp", "pharmacy_npi", "pharmacy_is_excluded"]:
-        if col in net.columns:
-            net[col] = net[col].astype(str).str.strip()
+    if cached_maps is None and use_cache:
+        cached_maps = _load_persistent_cache(network_signature)
 
     if cached_maps is None:
-        # Clean and normalize network values before creating maps
-        net["pharmacy_is_excluded_clean"] = net["pharmacy_is_excluded"].astype(str).str.strip().str.lower()
-        nabp_map = net.dropna(subset=["pharmacy_nabp"]).set_index("pharmacy_nabp")["pharmacy_is_excluded_clean"].to_dict()
-        npi_map = net.dropna(subset=["pharmacy_npi"]).set_index("pharmacy_npi")["pharmacy_is_excluded_clean"].to_dict()
+        nabp_map = _exclusion_lookup(network, "pharmacy_nabp")
+        npi_map = _exclusion_lookup(network, "pharmacy_npi")
         if use_cache:
             _PHARMACY_EXCLUSION_CACHE[network_signature] = (nabp_map, npi_map)
             if persist:
-                _save_persistent_cache()
+                _save_persistent_cache(network_signature)
     else:
         nabp_map, npi_map = cached_maps
 
 
     # Extract claim identifiers as cleaned strings
-    nabp_claim = df.get("NABP", pd.Series(index=df.index, dtype=object)).astype(str).str.strip().str.upper()
-    npi_claim = df.get("PHARMACYNPI", pd.Series(index=df.index, dtype=object)).astype(str).str.strip().str.upper()
-
-    # Clean network keys for robust matching (values are already lowercase from map creation)
-    nabp_map_clean = {str(k).strip().upper(): v for k, v in nabp_map.items()}
-    npi_map_clean = {str(k).strip().upper(): v for k, v in npi_map.items()}
+    nabp_claim = _to_arrow_str(df.get("NABP", pd.Series(index=df.index, dtype=object))).str.strip().str.upper()
+    npi_claim = _to_arrow_str(df.get("PHARMACYNPI", pd.Series(index=df.index, dtype=object))).str.strip().str.upper()
 
-    # Determine matches
-    nabp_raw = nabp_claim.map(nabp_map_clean)
-    need_npi = nabp_raw.isna() | (nabp_claim == "") | (nabp_claim == "N/A")
-    npi_raw = pd.Series([None]*len(df), index=df.index)
-    npi_subset = npi_claim[need_npi]
-    npi_raw.loc[need_npi] = npi_subset.map(npi_map_clean)
+    # Determine matches; mapping through an indexed Series stays in pandas'
+    # hash table code, with the keys already cleaned when it was built. The
+    # lookups hold int8 result codes, so claims only carry small numbers
+    # until the final take
+    nabp_raw = nabp_claim.map(nabp_map)
+    nabp_hit = nabp_raw.notna()
+    npi_raw = npi_claim.map(npi_map)
 
-    # Combine preference: NABP if matched else NPI else None if unmatched
-    combined = nabp_raw.where(~nabp_raw.isna(), npi_raw)
+    # Combine preference: NABP if matched else NPI else REVIEW if unmatched
+    combined = nabp_raw.where(nabp_hit, npi_raw)
+    codes = combined.fillna(_REVIEW_CODE).to_numpy(dtype=np.int8)
 
     # Normalize: "yes"->True, "no"->False, blanks/unexpected->"REVIEW"
-    resolved = combined.apply(normalize_pharmacy_is_excluded)
+    resolved = pd.Series(
+        np.array(_EXCLUSION_RESULTS, dtype=object).take(codes),
+        index=df.index,
+        name=combined.name,
+    )
 
     # Stats logging convenience (optional: caller can log)
     try:
-        import logging as _lg
         cache_hit = cached_maps is not None and use_cache
-        _lg.getLogger(__name__).info(
-            f"Vector resolve stats -> NABP matches: {(~nabp_raw.isna()).sum()}, NPI matches: {(~npi_raw.isna()).sum()}, REVIEW: {(resolved == 'REVIEW').sum()} | cache_hit={cache_hit}"
+        logging.getLogger(__name__).info(
+            f"Vector resolve stats -> NABP matches: {nabp_hit.sum()}, NPI matches: {(~nabp_hit & npi_raw.notna()).sum()}, REVIEW: {(codes == _REVIEW_CODE).sum()} | cache_hit={cache_hit}"
         )
     except Exception:
         pass
@@ -339,18 +653,22 @@ def vectorized_resolve_pharmacy_exclusion(df: pd.DataFrame, network: pd.DataFram
     return resolved
 
 
-def drop_duplicates_df(df):
+def drop_duplicates_df(df, subset=None, keep="first", ignore_index=False):
     """
     Drops duplicate rows from the DataFrame.
 
     Args:
         df (pd.DataFrame): DataFrame to deduplicate.
+        subset (list, optional): Columns that identify a row. Only these are
+            hashed, which is much cheaper on wide frames. Defaults to all columns.
+        keep (str): Which duplicate to keep, 'first' or 'last'.
+        ignore_index (bool): Give the result a fresh RangeIndex instead of
+            keeping the surviving row labels.
 
     Returns:
         pd.DataFrame: Deduplicated DataFrame.
     """
-    df = df.drop_duplicates()
-    return df.drop_duplicates()
+    return df.drop_duplicates(subset=subset, keep=keep, ignore_index=ignore_index)
 
 
 def clean_logic_and_tier(df, logic_col="Logic", tier_col="FormularyTier"):
@@ -360,16 +678,23 @@ def clean_logic_and_tier(df, logic_col="Logic", tier_col="FormularyTier"):
         - If all entries are numeric-like, coerces to numeric
         - Otherwise, strips and uppercases text for brand/generic disruptions
     """
-    df[logic_col] = pd.to_numeric(df[logic_col], errors="coerce")
+    import pandas as pd
 
-    # Inspect tier values
-    sample = df[tier_col].dropna().astype(str).head(10)
-    numeric_like = sample.str.replace(".", "", regex=False).str.isnumeric().all()
+    df[logic_col] = pd.to_numeric(df[logic_col], errors="coerce")
 
-    if numeric_like:
-        df[tier_col] = pd.to_numeric(df[tier_col], errors="coerce")
+    # The tier is numeric only if every present value parses, not just the
+    # first few; a text value near the top settles it without the full parse
+    tiers = df[tier_col]
+    head = tiers.head(100).dropna()
+    coerced = None
+    if pd.to_numeric(head, errors="coerce").notna().all():
+        coerced = pd.to_numeric(tiers, errors="coerce")
+    if coerced is not None and coerced.notna().equals(tiers.notna()):
+        df[tier_col] = coerced
     else:
-        df[tier_col] = df[tier_col].astype(str).str.strip().str.upper()
+        # Missing tiers keep the "NAN" text astype(str) gave them, so
+        # equality masks on the column never contain NA
+        df[tier_col] = _to_arrow_str(tiers).str.strip().str.upper().fillna("NAN")
 
     return df
 
@@ -385,9 +710,22 @@ def filter_recent_date(df, date_col="DATEFILLED"):
     Returns:
         pd.DataFrame: Filtered DataFrame.
     """
-    latest = df[date_col].max()
+    import pandas as pd
+
+    dates = df[date_col]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors="coerce")
+    # Claims exported in fill-date order are sorted (and NaT-free, which the
+    # monotonic check also guarantees), so the window is a binary search away
+    if dates.is_monotonic_increasing and len(dates):
+        latest = dates.iloc[-1]
+        start = latest - pd.DateOffset(months=6) + pd.DateOffset(days=1)
+        return df.iloc[dates.searchsorted(start, side="left"):]
+    latest = dates.max()
     start = latest - pd.DateOffset(months=6) + pd.DateOffset(days=1)
-    return df[(df[date_col] >= start) & (df[date_col] <= latest)]
+    # Every date is <= latest and NaT compares False, so the lower bound alone
+    # selects the window
+    return df[(dates >= start).to_numpy()]
 
 
 def filter_logic_and_maintenance(df, config=None):
@@ -405,13 +743,28 @@ def filter_logic_and_maintenance(df, config=None):
     if config is None:
         config = LogicMaintenanceConfig()
 
+    maint = df[config.maint_col]
+    # Categorical columns (as loaded from Medi-Span) already compare on their
+    # integer codes; a plain object column compares faster as a NumPy array
+    if maint.dtype == object:
+        is_maint = maint.to_numpy() == "Y"
+    else:
+        is_maint = maint == "Y"
+
     return df[
         (df[config.logic_col] >= config.min_logic)
         & (df[config.logic_col] <= config.max_logic)
-        & (df[config.maint_col] == "Y")
+        & is_maint
     ]
 
 
+# One alternation scans the column once instead of once per pattern. Kept as
+# strings (matched with case=False): Arrow-backed columns only run regexes in
+# their C++ kernel for string patterns, not compiled re objects
+_EXCLUDED_PRODUCT_PATTERN = r"\b(?:albuterol|ventolin|epinephrine)\b"
+_EXCLUDED_ALTERNATIVE_PATTERN = r"Covered|Use different NDC"
+
+
 def filter_products_and_alternative(
     df, product_col="Product Name", alternative_col="Alternative"
 ):
@@ -427,12 +780,10 @@ def filter_products_and_alternative(
     Returns:
         pd.DataFrame: Filtered DataFrame.
     """
-    exclude_pats = [r"\balbuterol\b", r"\bventolin\b", r"\bepinephrine\b"]
-    for pat in exclude_pats:
-        df = df[~df[product_col].str.contains(pat, case=False, na=False)]
-    df = df[
-        ~df[alternative_col]
-        .astype(str)
-        .str.contains(r"Covered|Use different NDC", case=False, regex=True, na=False)
-    ]
-    return df
+    product_hit = _to_arrow_str(df[product_col]).str.contains(
+        _EXCLUDED_PRODUCT_PATTERN, case=False, na=False
+    )
+    alternative_hit = _to_arrow_str(df[alternative_col]).str.contains(
+        _EXCLUDED_ALTERNATIVE_PATTERN, case=False, na=False
+    )
+    return df[~(product_hit | alternative_hit)]